@@ -0,0 +1,72 @@
+
+import numpy as np
+import pandas as pd
+
+# Vocabulary for string columns; mixed case and padding give fix_structural real work to do
+WORDS = np.array([
+    'alpha', 'Bravo', 'CHARLIE', 'delta', 'Echo', 'foxtrot', 'GOLF', 'hotel', 'India', 'juliet',
+    'KILO', 'lima', 'Mike', 'november', 'OSCAR', 'papa', 'Quebec', 'romeo', 'SIERRA', 'tango'
+], dtype=object)
+
+CATEGORIES = np.array(['north', 'south', 'east', 'west', 'central'], dtype=object)
+
+# Number of columns for each width, not counting the fixed 'category' and 'name' columns
+WIDTHS = {'narrow': 6, 'wide': 60}
+
+# Share of the remaining columns that hold strings, by kind
+STRING_SHARE = {'numeric': 0.0, 'mixed': 0.5, 'string': 0.8}
+
+def make_frame(rows, width='narrow', kind='numeric', null_rate=0.0, duplicate_rate=0.01, seed=0):
+    """
+    Generate a reproducible synthetic DataFrame.
+
+    Every frame has a low-cardinality 'category' column (never null) and a 'name' column of
+    space-separated word pairs, followed by numeric columns 'num_0', 'num_1', ... and string
+    columns 'str_0', 'str_1', ... in the proportion set by kind. There are always at least
+    two numeric columns.
+
+    Parameters:
+        rows (int): Number of rows.
+        width (str): 'narrow' or 'wide'.
+        kind (str): 'numeric', 'mixed' or 'string' (string-heavy).
+        null_rate (float): Fraction of values set to missing in every column except 'category'.
+        duplicate_rate (float): Fraction of rows replaced by copies of other rows.
+        seed (int): Random seed.
+
+    Returns:
+        pd.DataFrame: Generated data.
+    """
+    rng = np.random.default_rng(seed)
+    n_columns = WIDTHS[width]
+    n_strings = int(round(n_columns * STRING_SHARE[kind]))
+    n_numeric = max(2, n_columns - n_strings)
+
+    data = {
+        'category': CATEGORIES[rng.integers(0, len(CATEGORIES), rows)],
+        'name': WORDS[rng.integers(0, len(WORDS), rows)] + ' ' + WORDS[rng.integers(0, len(WORDS), rows)]
+    }
+    for i in range(n_numeric):
+        if i % 3 == 2:
+            data[f'num_{i}'] = rng.integers(0, 1000, rows).astype(np.float64)
+        else:
+            data[f'num_{i}'] = rng.normal(loc=100 * i, scale=10 + i, size=rows)
+    for i in range(n_strings):
+        data[f'str_{i}'] = WORDS[rng.integers(0, len(WORDS), rows)]
+    df = pd.DataFrame(data)
+
+    if null_rate > 0:
+        for column in df.columns.drop('category'):
+            mask = rng.random(rows) < null_rate
+            df.loc[mask, column] = np.nan if column.startswith('num_') else None
+
+    if duplicate_rate > 0:
+        n_duplicates = int(rows * duplicate_rate)
+        positions = np.arange(rows)
+        positions[rng.choice(rows, n_duplicates, replace=False)] = rng.choice(rows, n_duplicates, replace=True)
+        df = df.iloc[positions].reset_index(drop=True)
+
+    return df
+
+def dataset_name(width, kind, null_rate):
+    """Stable identifier of a generated dataset, used to match results across versions."""
+    return f"{width}-{kind}-null{null_rate:g}"
@@ -0,0 +1,247 @@
+"""
+Benchmark suite for dataanalysts.
+
+Times every public function in load, cleaner, transformer, summary and visualizer on
+synthetic datasets, measures peak traced memory, and writes machine-readable JSON that
+can be compared against the results of another version.
+
+Usage:
+    python benchmarks/run.py --sizes 10000 100000 --output results.json
+    python benchmarks/run.py --output new.json --compare baseline.json --threshold 1.25
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import tracemalloc
+import contextlib
+import statistics
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import dataanalysts as da
+from generators import make_frame, dataset_name
+
+def _numeric(df):
+    return df.select_dtypes(include=['number'])
+
+def _csv_file(df, workdir):
+    path = os.path.join(workdir, 'data.csv')
+    df.to_csv(path, index=False)
+    return path
+
+def _excel_file(df, workdir):
+    path = os.path.join(workdir, 'data.xlsx')
+    df.to_excel(path, index=False)
+    return path
+
+def _clean(strategy, **kwargs):
+    return lambda df: da.clean(df, strategy=strategy, **kwargs)
+
+# Each case: module, function label, run(input), and optionally
+#   prepare(df, workdir) -> input   untimed setup (e.g. write the file to load)
+#   mutates                         the function modifies its input, so each run gets a copy
+#   max_rows                        skip datasets larger than this (slow or format-limited paths)
+CASES = [
+    {'module': 'load', 'function': 'csv', 'prepare': _csv_file, 'run': da.csv},
+    {'module': 'load', 'function': 'csv_chunks', 'prepare': _csv_file,
+     'run': lambda path: sum(len(chunk) for chunk in da.csv_chunks(path, chunksize=100000))},
+    {'module': 'load', 'function': 'excel', 'prepare': _excel_file, 'run': da.excel, 'max_rows': 100000},
+
+    {'module': 'cleaner', 'function': 'clean[remove_duplicates]', 'run': _clean('remove_duplicates'), 'mutates': True},
+    {'module': 'cleaner', 'function': 'clean[handle_missing:mean]', 'run': _clean('handle_missing', missing_strategy='mean'), 'mutates': True},
+    {'module': 'cleaner', 'function': 'clean[handle_missing:median]', 'run': _clean('handle_missing', missing_strategy='median'), 'mutates': True},
+    {'module': 'cleaner', 'function': 'clean[handle_missing:fill]',
+     'run': _clean('handle_missing', missing_strategy='fill', value={'num_0': 0, 'name': 'unknown'})},
+    {'module': 'cleaner', 'function': 'clean[fix_structural]',
+     'run': _clean('fix_structural', column='name', fix_strategy='lowercase'), 'mutates': True},
+    {'module': 'cleaner', 'function': 'clean[handle_outliers]', 'run': _clean('handle_outliers', column='num_0'), 'mutates': True},
+    {'module': 'cleaner', 'function': 'clean[convert_dtype]', 'run': _clean('convert_dtype', column='num_1', dtype='float32'), 'mutates': True},
+    {'module': 'cleaner', 'function': 'clean[encode_categorical]', 'run': _clean('encode_categorical', columns=['category'])},
+    {'module': 'cleaner', 'function': 'clean[scale]', 'run': _clean('scale', scaler='standard'), 'mutates': True},
+    {'module': 'cleaner', 'function': 'clean[filter]', 'run': _clean('filter', condition='num_1 > 100')},
+    {'module': 'cleaner', 'function': 'clean[split_column]',
+     'run': _clean('split_column', column='name', new_columns=['first', 'last'], delimiter=' '), 'mutates': True},
+    {'module': 'cleaner', 'function': 'clean[validate]', 'run': _clean('validate', column='num_0', min_value=0, max_value=50), 'mutates': True},
+
+    {'module': 'transformer', 'function': 'transform[standard]', 'prepare': lambda df, workdir: _numeric(df),
+     'run': lambda df: da.transform(df, strategy='standard'), 'mutates': True},
+    {'module': 'transformer', 'function': 'transform[robust]', 'prepare': lambda df, workdir: _numeric(df),
+     'run': lambda df: da.transform(df, strategy='robust'), 'mutates': True},
+    {'module': 'transformer', 'function': 'transform[encode_categorical]',
+     'prepare': lambda df, workdir: df.dropna(), 'run': lambda df: da.transform(df, encode_categorical=True), 'mutates': True},
+    {'module': 'transformer', 'function': 'transform[low_variance]', 'prepare': lambda df, workdir: _numeric(df).fillna(0),
+     'run': lambda df: da.transform(df, remove_low_variance=True), 'mutates': True},
+    {'module': 'transformer', 'function': 'transform[pca]', 'prepare': lambda df, workdir: _numeric(df).fillna(0),
+     'run': lambda df: da.transform(df, reduce_dimensionality=True, n_components=2), 'mutates': True},
+
+    {'module': 'summary', 'function': 'summary', 'run': da.summary},
+    {'module': 'streaming', 'function': 'distribution_stats', 'run': lambda df: da.distribution_stats(df, 'num_0', by='category')},
+
+    {'module': 'visualizer', 'function': 'histogram', 'run': lambda df: da.histogram(df, 'num_0', output='png'), 'max_rows': 1000000},
+    {'module': 'visualizer', 'function': 'barchart', 'run': lambda df: da.barchart(df, 'category', 'num_0', output='png'), 'max_rows': 100000},
+    {'module': 'visualizer', 'function': 'linechart', 'run': lambda df: da.linechart(df, 'num_0', 'num_1', output='png'), 'max_rows': 100000},
+    {'module': 'visualizer', 'function': 'scatter', 'run': lambda df: da.scatter(df, 'num_0', 'num_1', hue='category', output='png')},
+    {'module': 'visualizer', 'function': 'heatmap', 'run': lambda df: da.heatmap(df, output='png')},
+    {'module': 'visualizer', 'function': 'pairplot', 'run': lambda df: da.pairplot(df, hue='category', max_columns=4, output='png')},
+    {'module': 'visualizer', 'function': 'boxplot', 'run': lambda df: da.boxplot(df, 'category', 'num_0', output='png'), 'max_rows': 1000000},
+    {'module': 'visualizer', 'function': 'violinplot', 'run': lambda df: da.violinplot(df, 'category', 'num_0', output='png'), 'max_rows': 1000000},
+]
+
+def _measure(case, data, repeat):
+    """Run one case; returns wall times of each repeat and the peak traced memory of one extra run."""
+    times = []
+    for _ in range(repeat):
+        arg = data.copy() if case.get('mutates') else data
+        start = time.perf_counter()
+        case['run'](arg)
+        times.append(time.perf_counter() - start)
+
+    arg = data.copy() if case.get('mutates') else data
+    tracemalloc.start()
+    try:
+        case['run'](arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return times, peak
+
+def run_benchmarks(sizes, widths, kinds, null_rates, repeat=3, modules=None, seed=0):
+    """
+    Run every selected case on every generated dataset.
+
+    Returns:
+        list of dict: One record per (case, dataset) with timings in seconds, peak memory in MiB and a status.
+    """
+    da.set_headless(True)
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for rows in sizes:
+            for width in widths:
+                for kind in kinds:
+                    for null_rate in null_rates:
+                        df = make_frame(rows, width=width, kind=kind, null_rate=null_rate, seed=seed)
+                        dataset = dataset_name(width, kind, null_rate)
+                        for case in CASES:
+                            if modules and case['module'] not in modules:
+                                continue
+                            record = {
+                                'case': f"{case['module']}.{case['function']}",
+                                'dataset': dataset,
+                                'rows': rows
+                            }
+                            if rows > case.get('max_rows', float('inf')):
+                                record['status'] = 'skipped'
+                                results.append(record)
+                                continue
+                            try:
+                                # Library functions print progress; keep the report readable
+                                with contextlib.redirect_stdout(io.StringIO()):
+                                    data = case['prepare'](df, workdir) if 'prepare' in case else df
+                                    times, peak = _measure(case, data, repeat)
+                                record.update({
+                                    'status': 'ok',
+                                    'time_min': min(times),
+                                    'time_median': statistics.median(times),
+                                    'peak_mib': peak / 1024 ** 2
+                                })
+                            except Exception as e:
+                                record.update({'status': 'error', 'error': str(e)})
+                            results.append(record)
+                            _print_record(record)
+    return results
+
+def _print_record(record):
+    if record['status'] == 'ok':
+        print(f"{record['case']:<45} {record['dataset']:<24} {record['rows']:>11,} "
+              f"{record['time_min']:>9.4f}s {record['peak_mib']:>10.1f} MiB")
+    else:
+        print(f"{record['case']:<45} {record['dataset']:<24} {record['rows']:>11,} {record['status']}")
+
+def compare(results, baseline, threshold):
+    """
+    Flag cases that got slower or used more memory than in the baseline by more than threshold.
+
+    Returns:
+        list of dict: Regressions with the metric, old and new values and their ratio.
+    """
+    previous = {
+        (record['case'], record['dataset'], record['rows']): record
+        for record in baseline['results'] if record['status'] == 'ok'
+    }
+    regressions = []
+    for record in results:
+        old = previous.get((record['case'], record['dataset'], record['rows']))
+        if record['status'] != 'ok' or old is None:
+            continue
+        for metric in ('time_min', 'peak_mib'):
+            if old[metric] > 0 and record[metric] / old[metric] > threshold:
+                regressions.append({
+                    'case': record['case'],
+                    'dataset': record['dataset'],
+                    'rows': record['rows'],
+                    'metric': metric,
+                    'baseline': old[metric],
+                    'current': record[metric],
+                    'ratio': record[metric] / old[metric]
+                })
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark dataanalysts on synthetic data.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000],
+                        help='Row counts to generate (e.g. 10000 1000000 100000000).')
+    parser.add_argument('--widths', nargs='+', default=['narrow', 'wide'], choices=['narrow', 'wide'])
+    parser.add_argument('--kinds', nargs='+', default=['numeric', 'string'], choices=['numeric', 'mixed', 'string'])
+    parser.add_argument('--null-rates', type=float, nargs='+', default=[0.0, 0.1])
+    parser.add_argument('--modules', nargs='+', help='Only run cases from these modules.')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed repetitions per case.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='benchmark_results.json', help='Where to write the JSON results.')
+    parser.add_argument('--compare', help='Baseline JSON results to compare against.')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='Ratio above which a slowdown or memory increase is flagged.')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.widths, args.kinds, args.null_rates,
+                             repeat=args.repeat, modules=args.modules, seed=args.seed)
+    report = {
+        'meta': {
+            'dataanalysts': da.__version__,
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'args': vars(args)
+        },
+        'results': results
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {len(results)} results to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression['case']} {regression['dataset']} {regression['rows']:,} rows: "
+                  f"{regression['metric']} {regression['baseline']:.4g} -> {regression['current']:.4g} "
+                  f"(x{regression['ratio']:.2f})")
+        print(f"{len(regressions)} regressions against {baseline['meta']['dataanalysts']} (threshold x{args.threshold}).")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -15,11 +15,31 @@ from .visualizer import (
     pairplot,
     boxplot,
     violinplot,
-    interactive_plot
+    interactive_plot,
+    set_headless,
+    render_batch,
+    enable_render_cache,
+    disable_render_cache,
+    render_cache_stats
 )
 
 # Data Loading
-from .load import csv, excel
+from .load import csv, excel, csv_chunks, csv_async, excel_async, csv_chunks_async, load_many_async
+
+# Data Validation
+from .validation import validate, invalid_rows
+
+# Data Integration
+from .integrate import merge, merge_chunks
+
+# Data Export
+from .export import export, ExportWriter
+
+# Batch Pipelines
+from .pipeline import run_pipeline
+
+# Streaming Statistics
+from .streaming import distribution_stats
 
 # Exceptions
 from .exceptions import (
@@ -36,6 +56,12 @@ from .exceptions import (
 #Summary
 from .summary import summary
 
+# Result Cache
+from .cache import enable_result_cache, disable_result_cache, result_cache_stats
+
+# Execution Backends
+from .backends import set_backend, get_backend, available_backends
+
 
 # Module Metadata
 __version__ = "2.1.0"
@@ -64,10 +90,48 @@ __all__ = [
     "boxplot",
     "violinplot",
     "interactive_plot",
+    "set_headless",
+    "render_batch",
+    "enable_render_cache",
+    "disable_render_cache",
+    "render_cache_stats",
+
+    # Result Cache
+    "enable_result_cache",
+    "disable_result_cache",
+    "result_cache_stats",
+
+    # Backends
+    "set_backend",
+    "get_backend",
+    "available_backends",
 
     # Loader
     "csv",
     "excel",
+    "csv_chunks",
+    "csv_async",
+    "excel_async",
+    "csv_chunks_async",
+    "load_many_async",
+
+    # Validation
+    "validate",
+    "invalid_rows",
+
+    # Integration
+    "merge",
+    "merge_chunks",
+
+    # Export
+    "export",
+    "ExportWriter",
+
+    # Pipeline
+    "run_pipeline",
+
+    # Streaming
+    "distribution_stats",
 
     # Exceptions
     "DataCleaningError",
@@ -0,0 +1,380 @@
+
+import logging
+import numpy as np
+import pandas as pd
+
+# Backend used when clean()/summary() are called without backend=; see set_backend()
+_DEFAULT_BACKEND = 'pandas'
+
+# Order in which 'auto' tries the columnar engines
+_AUTO_ORDER = ('polars', 'arrow')
+
+def is_numeric_column(series):
+    """True for numeric (non-boolean) columns, the ones summary() reports min/max/mean/median for."""
+    return pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype)
+
+def is_text_column(series):
+    """True for object and pandas string columns, the ones summary() reports top/frequency for."""
+    return series.dtype == object or isinstance(series.dtype, pd.StringDtype)
+
+def _like(values, like):
+    """Convert an Arrow array back to pandas, keeping the dtype family of the original column."""
+    if isinstance(like.dtype, pd.StringDtype):
+        return pd.array(values, dtype=like.dtype)
+    result = values.to_numpy(zero_copy_only=False).astype(object)
+    result[values.is_null().to_numpy(zero_copy_only=False)] = None
+    # Like pandas string methods, rows missing in the original keep their own sentinel (None or
+    # NaN); values missing only in the result, such as absent split parts, are None
+    original = like.to_numpy(dtype=object)
+    missing = pd.isna(original)
+    result[missing] = original[missing]
+    return pd.Series(result, index=like.index, dtype=object)
+
+def _summary_row(df, column, non_null, unique, numeric=None, top=None, frequency=None):
+    """Assemble one summary() row in the same layout as the pandas implementation."""
+    row = {
+        'Column': column,
+        'Data Type': df[column].dtype,
+        'Non-Null Count': non_null,
+        'Unique Values': unique,
+        'Min': None,
+        'Max': None,
+        'Mean': None,
+        'Median': None,
+        'Top': None,
+        'Frequency': None
+    }
+    if numeric is not None:
+        row.update(dict(zip(['Min', 'Max', 'Mean', 'Median'], numeric)))
+    elif top is not None:
+        row.update({'Top': top, 'Frequency': frequency if top else None})
+    return row
+
+class PandasBackend:
+    """
+    Reference backend: every strategy runs through the original pandas code in cleaner and summary.
+    """
+    name = 'pandas'
+    strategies = frozenset()
+
+    def supports(self, strategy):
+        return strategy in self.strategies
+
+class PolarsBackend(PandasBackend):
+    """
+    Polars backend for string-heavy and column-wise cleaning and for summary statistics.
+
+    Column statistics are computed in one multi-threaded Polars query and written back into
+    the original pandas frame, so index, column order and dtypes match the pandas path.
+    """
+    name = 'polars'
+    strategies = frozenset([
+        'remove_duplicates', 'handle_missing', 'fix_structural', 'handle_outliers', 'scale', 'split_column'
+    ])
+
+    def __init__(self):
+        import polars
+        self.pl = polars
+
+    def _frame(self, df, columns=None):
+        return self.pl.from_pandas(df if columns is None else df[list(columns)])
+
+    def clean(self, df, strategy, **kwargs):
+        pl = self.pl
+
+        if strategy == 'remove_duplicates':
+            # Rows are dropped from the caller's frame, as drop_duplicates(inplace=True) does;
+            # with repeated index labels that cannot be done by label, so pandas handles it
+            if not df.index.is_unique:
+                return None
+            first = self._frame(df).select(pl.struct(pl.all()).is_first_distinct()).to_series().to_numpy()
+            print(f"Removed {len(df) - int(first.sum())} duplicate rows.")
+            df.drop(index=df.index[~first], inplace=True)
+            return df
+
+        if strategy == 'handle_missing':
+            missing_strategy = kwargs.get('missing_strategy', 'mean')
+            if missing_strategy not in ['mean', 'median', 'mode']:
+                return None
+            columns = list(df.select_dtypes(include=['number']).columns)
+            if missing_strategy == 'mode':
+                exprs = [pl.col(col).drop_nulls().mode().min().alias(col) for col in columns]
+            else:
+                exprs = [getattr(pl.col(col), missing_strategy)().alias(col) for col in columns]
+            fills = self._frame(df, columns).select(exprs).row(0, named=True) if columns else {}
+            for col, fill in fills.items():
+                if fill is not None:
+                    df[col] = df[col].fillna(fill)
+            print(f"Filled missing values using {missing_strategy} strategy.")
+            return df
+
+        if strategy == 'fix_structural':
+            column = kwargs.get('column')
+            if column not in df.columns:
+                return df
+            fix_strategy = kwargs.get('fix_strategy', 'lowercase')
+            series = self._frame(df, [column]).to_series()
+            if series.dtype != pl.String:
+                return None
+            if fix_strategy == 'lowercase':
+                df[column] = _like(series.str.to_lowercase().to_arrow(), df[column])
+            elif fix_strategy == 'uppercase':
+                df[column] = _like(series.str.to_uppercase().to_arrow(), df[column])
+            print(f"Fixed structural issues in column {column} using {fix_strategy} strategy.")
+            return df
+
+        if strategy == 'handle_outliers':
+            column = kwargs.get('column', None)
+            if not (column and column in df.columns):
+                return df
+            q1, q3 = self._frame(df, [column]).select(
+                pl.col(column).quantile(0.25, interpolation='linear').alias('q1'),
+                pl.col(column).quantile(0.75, interpolation='linear').alias('q3')
+            ).row(0)
+            iqr = q3 - q1
+            lower_bound = q1 - 1.5 * iqr
+            upper_bound = q3 + 1.5 * iqr
+            df[column] = np.where(df[column] < lower_bound, lower_bound, df[column])
+            df[column] = np.where(df[column] > upper_bound, upper_bound, df[column])
+            print(f"Handled outliers in column {column} using the IQR method.")
+            return df
+
+        if strategy == 'scale':
+            columns = list(kwargs.get('columns', df.select_dtypes(include=['number']).columns))
+            scaler = kwargs.get('scaler', 'minmax')
+            aggregations = ('min', 'max') if scaler == 'minmax' else ('mean', 'std')
+            stats = self._frame(df, columns).select([
+                getattr(pl.col(col), agg)().alias(f'{col}\0{agg}') for col in columns for agg in aggregations
+            ]).row(0, named=True) if columns else {}
+            for col in columns:
+                a, b = (stats[f'{col}\0{agg}'] for agg in aggregations)
+                a, b = (np.nan if a is None else a), (np.nan if b is None else b)
+                if scaler == 'minmax':
+                    df[col] = (df[col] - a) / (b - a)
+                elif scaler == 'standard':
+                    df[col] = (df[col] - a) / b
+            print(f"Scaled columns {columns} using {scaler} scaling.")
+            return df
+
+        if strategy == 'split_column':
+            column = kwargs.get('column')
+            new_columns = kwargs.get('new_columns', [])
+            delimiter = kwargs.get('delimiter', ' ')
+            if column not in df.columns:
+                return df
+            series = self._frame(df, [column]).to_series()
+            if series.dtype != pl.String:
+                return None
+            parts = series.str.split(delimiter)
+            n_parts = parts.list.len().max() or 0
+            if n_parts != len(new_columns):
+                raise ValueError("Columns must be same length as key")
+            for i, new_column in enumerate(new_columns):
+                df[new_column] = _like(parts.list.get(i, null_on_oob=True).to_arrow(), df[column])
+            print(f"Split column {column} into {new_columns}.")
+            return df
+
+        return None
+
+    def summary(self, df):
+        pl = self.pl
+        numeric = [col for col in df.columns if is_numeric_column(df[col])]
+        text = [col for col in df.columns if is_text_column(df[col])]
+        frame = self._frame(df)
+
+        exprs = []
+        for col in df.columns:
+            exprs.append(pl.col(col).count().alias(f'{col}\0count'))
+            exprs.append(pl.col(col).drop_nulls().n_unique().alias(f'{col}\0unique'))
+        for col in numeric:
+            for agg in ('min', 'max', 'mean', 'median'):
+                exprs.append(getattr(pl.col(col), agg)().alias(f'{col}\0{agg}'))
+        for col in text:
+            exprs.append(pl.col(col).drop_nulls().mode().min().alias(f'{col}\0top'))
+        stats = frame.select(exprs).row(0, named=True)
+
+        rows = []
+        for col in df.columns:
+            kwargs = {}
+            if col in numeric:
+                kwargs['numeric'] = [stats[f'{col}\0{agg}'] for agg in ('min', 'max', 'mean', 'median')]
+            elif col in text:
+                top = stats[f'{col}\0top']
+                frequency = frame.select((pl.col(col) == top).sum()).item() if top is not None else None
+                kwargs.update({'top': top, 'frequency': frequency})
+            rows.append(_summary_row(df, col, stats[f'{col}\0count'], stats[f'{col}\0unique'], **kwargs))
+        return pd.DataFrame(rows)
+
+class ArrowBackend(PandasBackend):
+    """
+    PyArrow compute backend for string case fixes, missing-value statistics, outliers, scaling and summary.
+
+    Columns are converted with pa.array(..., from_pandas=True), which is zero-copy for numeric
+    columns without missing values and for Arrow-backed pandas string columns.
+    """
+    name = 'arrow'
+    strategies = frozenset(['handle_missing', 'fix_structural', 'handle_outliers', 'scale'])
+
+    def __init__(self):
+        import pyarrow
+        import pyarrow.compute
+        self.pa = pyarrow
+        self.pc = pyarrow.compute
+
+    def _array(self, series):
+        return self.pa.array(series, from_pandas=True)
+
+    def _scalar(self, value):
+        value = value.as_py()
+        return np.nan if value is None else value
+
+    def _quantile(self, array, q):
+        return self._scalar(self.pc.quantile(array, q=q, interpolation='linear')[0])
+
+    def _mode(self, array):
+        modes = self.pc.mode(array, n=1)
+        return (modes[0]['mode'].as_py(), modes[0]['count'].as_py()) if len(modes) else (None, None)
+
+    def clean(self, df, strategy, **kwargs):
+        pa, pc = self.pa, self.pc
+
+        if strategy == 'handle_missing':
+            missing_strategy = kwargs.get('missing_strategy', 'mean')
+            if missing_strategy not in ['mean', 'median', 'mode']:
+                return None
+            for col in df.select_dtypes(include=['number']).columns:
+                array = self._array(df[col])
+                if missing_strategy == 'mean':
+                    fill = self._scalar(pc.mean(array))
+                elif missing_strategy == 'median':
+                    fill = self._quantile(array, 0.5)
+                else:
+                    fill = self._mode(array)[0]
+                if fill is not None and not pd.isna(fill):
+                    df[col] = df[col].fillna(fill)
+            print(f"Filled missing values using {missing_strategy} strategy.")
+            return df
+
+        if strategy == 'fix_structural':
+            column = kwargs.get('column')
+            if column not in df.columns:
+                return df
+            fix_strategy = kwargs.get('fix_strategy', 'lowercase')
+            array = self._array(df[column])
+            if not (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+                return None
+            if fix_strategy == 'lowercase':
+                df[column] = _like(pc.utf8_lower(array), df[column])
+            elif fix_strategy == 'uppercase':
+                df[column] = _like(pc.utf8_upper(array), df[column])
+            print(f"Fixed structural issues in column {column} using {fix_strategy} strategy.")
+            return df
+
+        if strategy == 'handle_outliers':
+            column = kwargs.get('column', None)
+            if not (column and column in df.columns):
+                return df
+            array = self._array(df[column])
+            q1, q3 = self._quantile(array, 0.25), self._quantile(array, 0.75)
+            iqr = q3 - q1
+            lower_bound = q1 - 1.5 * iqr
+            upper_bound = q3 + 1.5 * iqr
+            df[column] = np.where(df[column] < lower_bound, lower_bound, df[column])
+            df[column] = np.where(df[column] > upper_bound, upper_bound, df[column])
+            print(f"Handled outliers in column {column} using the IQR method.")
+            return df
+
+        if strategy == 'scale':
+            columns = kwargs.get('columns', df.select_dtypes(include=['number']).columns)
+            scaler = kwargs.get('scaler', 'minmax')
+            for col in columns:
+                array = self._array(df[col])
+                if scaler == 'minmax':
+                    bounds = pc.min_max(array)
+                    low, high = self._scalar(bounds['min']), self._scalar(bounds['max'])
+                    df[col] = (df[col] - low) / (high - low)
+                elif scaler == 'standard':
+                    mean, std = self._scalar(pc.mean(array)), self._scalar(pc.stddev(array, ddof=1))
+                    df[col] = (df[col] - mean) / std
+            print(f"Scaled columns {columns} using {scaler} scaling.")
+            return df
+
+        return None
+
+    def summary(self, df):
+        pc = self.pc
+        rows = []
+        for col in df.columns:
+            array = self._array(df[col])
+            kwargs = {}
+            if is_numeric_column(df[col]):
+                bounds = pc.min_max(array)
+                kwargs['numeric'] = [
+                    bounds['min'].as_py(), bounds['max'].as_py(), pc.mean(array).as_py(),
+                    pc.quantile(array, q=0.5, interpolation='linear')[0].as_py()
+                ]
+            elif is_text_column(df[col]):
+                top, frequency = self._mode(array)
+                kwargs.update({'top': top, 'frequency': frequency})
+            non_null = len(array) - array.null_count
+            unique = pc.count_distinct(array, mode='only_valid').as_py()
+            rows.append(_summary_row(df, col, non_null, unique, **kwargs))
+        return pd.DataFrame(rows)
+
+_BACKENDS = {
+    'pandas': PandasBackend,
+    'polars': PolarsBackend,
+    'arrow': ArrowBackend
+}
+
+def available_backends():
+    """
+    List the backends that can be used in this environment.
+
+    Returns:
+        list: Backend names whose engine is installed, always including 'pandas'.
+    """
+    names = []
+    for name, backend in _BACKENDS.items():
+        try:
+            backend()
+            names.append(name)
+        except ImportError:
+            pass
+    return names
+
+def set_backend(name):
+    """
+    Set the default execution backend for clean() and summary().
+
+    Parameters:
+        name (str): 'pandas', 'polars', 'arrow', or 'auto' to pick the first installed
+                    columnar engine (Polars, then Arrow) and fall back to pandas.
+    """
+    global _DEFAULT_BACKEND
+    if name != 'auto' and name not in _BACKENDS:
+        raise ValueError(f"Unknown backend '{name}'. Choose 'auto', {', '.join(repr(n) for n in _BACKENDS)}.")
+    _DEFAULT_BACKEND = name
+    logging.info(f"Default backend set to '{name}'.")
+
+def get_backend(name=None):
+    """
+    Resolve a backend name to a backend instance, falling back to pandas when the engine is missing.
+
+    Parameters:
+        name (str): Backend name, 'auto', or None for the default set with set_backend().
+
+    Returns:
+        PandasBackend: The backend instance.
+    """
+    name = name or _DEFAULT_BACKEND
+    candidates = _AUTO_ORDER if name == 'auto' else (name,)
+    for candidate in candidates:
+        if candidate not in _BACKENDS:
+            raise ValueError(f"Unknown backend '{candidate}'. Choose 'auto', {', '.join(repr(n) for n in _BACKENDS)}.")
+        try:
+            return _BACKENDS[candidate]()
+        except ImportError:
+            if name != 'auto':
+                logging.warning(f"Backend '{candidate}' is not installed; falling back to pandas.")
+    return PandasBackend()
@@ -0,0 +1,341 @@
+
+import os
+import hashlib
+import pickle
+import functools
+import threading
+import logging
+from collections import OrderedDict
+import pandas as pd
+from dataanalysts.exceptions import DataProcessingError
+
+# No logging.basicConfig here: cleaner and transformer import this module before their own
+# logging configuration runs, and only the first basicConfig call takes effect.
+
+def fingerprint(df, columns=None, include_index=False):
+    """
+    Compute a fast content fingerprint of a DataFrame.
+
+    Each referenced column is hashed with pandas' vectorized row hashing, so the cost is
+    one linear pass over those columns and unrelated columns are never touched.
+
+    Parameters:
+        df (pd.DataFrame): Input DataFrame.
+        columns (list): Columns to include. If None, every column is included.
+        include_index (bool): Whether the row index is part of the fingerprint.
+
+    Returns:
+        str: Hex digest identifying the column names, dtypes and values.
+    """
+    columns = list(df.columns) if columns is None else list(columns)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(len(df)).encode())
+    if include_index:
+        digest.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+    for column in columns:
+        digest.update(repr((column, str(df[column].dtype))).encode())
+        digest.update(pd.util.hash_pandas_object(df[column], index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def make_key(*parts):
+    """
+    Combine fingerprints and call parameters into a single cache key.
+
+    Parameters:
+        parts: Picklable values (fingerprints, parameter dicts, ...) that identify a call.
+
+    Returns:
+        str: Hex digest of the pickled parts.
+    """
+    return hashlib.blake2b(pickle.dumps(parts, protocol=4), digest_size=16).hexdigest()
+
+class LRUCache:
+    """
+    Thread-safe in-memory least-recently-used cache with entry and byte limits.
+
+    Attributes:
+        max_entries (int): Maximum number of entries kept.
+        max_bytes (int): Maximum total size of the entries, or None for no limit.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=None, sizeof=len):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def put(self, key, value):
+        size = self.sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self.current_bytes > self.max_bytes
+            ):
+                self.current_bytes -= self._entries.popitem(last=False)[1][1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+class DiskCache:
+    """
+    Directory-backed cache tier with size-based eviction of the least recently used files.
+
+    Values are stored one file per key. The dump/load callables define the file format,
+    so the same tier can hold rendered images or DataFrames.
+
+    Attributes:
+        directory (str): Directory holding the cache files.
+        max_bytes (int): Maximum total size of the cache files, or None for no limit.
+    """
+
+    def __init__(self, directory, max_bytes=None, suffix='.bin', dump=None, load=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.dump = dump or _write_bytes
+        self.load = load or _read_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + self.suffix)
+
+    def __contains__(self, key):
+        return os.path.exists(self._path(key))
+
+    def get(self, key, default=None):
+        path = self._path(key)
+        try:
+            value = self.load(path)
+            # Touch the file so eviction treats it as recently used
+            os.utime(path)
+        except OSError:
+            return default
+        return value
+
+    def put(self, key, value):
+        path = self._path(key)
+        # Write to a temporary file first so readers never see a partial entry
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        self.dump(value, temp_path)
+        os.replace(temp_path, path)
+        if self.max_bytes is not None:
+            self._evict()
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.directory):
+                if not name.endswith(self.suffix):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+            total = sum(size for _, size, _ in entries)
+            for _, size, name in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+    @property
+    def current_bytes(self):
+        return sum(
+            os.path.getsize(os.path.join(self.directory, name))
+            for name in os.listdir(self.directory) if name.endswith(self.suffix)
+        )
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith(self.suffix):
+                os.remove(os.path.join(self.directory, name))
+
+def _write_bytes(value, path):
+    with open(path, 'wb') as f:
+        f.write(value)
+
+def _read_bytes(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+class TieredCache:
+    """
+    In-memory LRU tier in front of an optional on-disk tier, with hit/miss counters.
+
+    Disk hits are promoted into memory. All counters are available through stats().
+
+    Attributes:
+        memory (LRUCache): In-memory tier.
+        disk (DiskCache): On-disk tier, or None.
+    """
+
+    def __init__(self, memory, disk=None):
+        self.memory = memory
+        self.disk = disk
+        self._counts = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0}
+        self._lock = threading.Lock()
+
+    def _count(self, name):
+        with self._lock:
+            self._counts[name] += 1
+
+    def get(self, key):
+        """Return the cached value for key, or None on a miss."""
+        value = self.memory.get(key)
+        if value is not None:
+            self._count('memory_hits')
+            return value
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self._count('disk_hits')
+                self.memory.put(key, value)
+                return value
+        self._count('misses')
+        return None
+
+    def put(self, key, value):
+        self.memory.put(key, value)
+        if self.disk is not None:
+            try:
+                self.disk.put(key, value)
+            except Exception as e:
+                logging.warning(f"Disk cache write failed for key {key}: {str(e)}")
+        self._count('stores')
+
+    def stats(self):
+        """
+        Return cache counters and sizes.
+
+        Returns:
+            dict: hits, misses, hit_rate, memory_hits, disk_hits, stores, memory_entries,
+                  memory_bytes and (with a disk tier) disk_bytes.
+        """
+        with self._lock:
+            counts = dict(self._counts)
+        hits = counts['memory_hits'] + counts['disk_hits']
+        lookups = hits + counts['misses']
+        stats = {
+            'hits': hits,
+            'misses': counts['misses'],
+            'hit_rate': hits / lookups if lookups else 0.0,
+            **counts,
+            'memory_entries': len(self.memory),
+            'memory_bytes': self.memory.current_bytes
+        }
+        if self.disk is not None:
+            stats['disk_bytes'] = self.disk.current_bytes
+        return stats
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+        with self._lock:
+            self._counts = dict.fromkeys(self._counts, 0)
+
+# Result cache for clean() and transform(); None until enable_result_cache() is called
+_RESULT_CACHE = None
+
+def _frame_bytes(df):
+    return int(df.memory_usage(deep=True).sum())
+
+def enable_result_cache(max_entries=32, max_bytes=1024 ** 3, disk_dir=None, disk_max_bytes=None):
+    """
+    Memoize clean() and transform() results keyed by the input's content and the call arguments.
+
+    The input frame is fingerprinted column by column (plus its index) before the call, so a
+    repeated call on unchanged data returns a copy of the stored result instead of recomputing.
+    While the cache is enabled, clean() and transform() never modify their input frame.
+
+    Parameters:
+        max_entries (int): Maximum number of results kept in memory.
+        max_bytes (int): Maximum total memory used by the in-memory results.
+        disk_dir (str): Directory for an on-disk tier storing results as Parquet files. Requires pyarrow.
+        disk_max_bytes (int): Maximum total size of the on-disk tier, or None for no limit.
+    """
+    global _RESULT_CACHE
+    disk = None
+    if disk_dir:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise DataProcessingError("The on-disk result cache requires pyarrow. Install it with 'pip install pyarrow'.")
+        disk = DiskCache(
+            disk_dir,
+            max_bytes=disk_max_bytes,
+            suffix='.parquet',
+            dump=lambda df, path: df.to_parquet(path),
+            load=pd.read_parquet
+        )
+    _RESULT_CACHE = TieredCache(LRUCache(max_entries=max_entries, max_bytes=max_bytes, sizeof=_frame_bytes), disk)
+    logging.info(f"Result cache enabled (max_entries={max_entries}, max_bytes={max_bytes}, disk_dir={disk_dir}).")
+
+def disable_result_cache():
+    """Turn the result cache off and drop its in-memory entries. On-disk entries are kept."""
+    global _RESULT_CACHE
+    if _RESULT_CACHE is not None:
+        _RESULT_CACHE.memory.clear()
+    _RESULT_CACHE = None
+    logging.info("Result cache disabled.")
+
+def result_cache_stats():
+    """
+    Return hit/miss counters of the clean()/transform() result cache.
+
+    Returns:
+        dict: Counters from TieredCache.stats(), or an empty dict when the cache is disabled.
+    """
+    return _RESULT_CACHE.stats() if _RESULT_CACHE is not None else {}
+
+def memoize_frame(func):
+    """
+    Serve repeated calls of a DataFrame -> DataFrame function from the result cache.
+
+    While the cache is enabled the input is never modified: on a miss the function runs on a
+    copy, so a miss and a later hit leave the caller's frame in the same state. Hits and
+    stored entries are copies too, so callers can never modify a cached result.
+    """
+    @functools.wraps(func)
+    def wrapper(df, *args, **kwargs):
+        if _RESULT_CACHE is None or not isinstance(df, pd.DataFrame):
+            return func(df, *args, **kwargs)
+
+        key = make_key(func.__module__, func.__name__, fingerprint(df, include_index=True), args, kwargs)
+        result = _RESULT_CACHE.get(key)
+        if result is not None:
+            logging.info(f"{func.__name__} served from result cache.")
+            return result.copy()
+
+        result = func(df.copy(), *args, **kwargs)
+        if isinstance(result, pd.DataFrame):
+            _RESULT_CACHE.put(key, result.copy())
+        return result
+    return wrapper
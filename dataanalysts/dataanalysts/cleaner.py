@@ -2,7 +2,10 @@
 import pandas as pd
 import numpy as np
 import logging
-from dataanalysts.exceptions import DataCleaningError
+from dataanalysts.exceptions import DataCleaningError, DataValidationError
+from dataanalysts.cache import memoize_frame
+from dataanalysts.backends import get_backend
+from dataanalysts.validation import validate, invalid_rows
 
 # Logging Configuration
 logging.basicConfig(
@@ -12,6 +15,17 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+def _clean_with_backend(backend, df, strategy, kwargs):
+    """Run a strategy on a columnar backend. Returns None when the pandas implementation should run instead."""
+    if not backend.supports(strategy):
+        return None
+    try:
+        return backend.clean(df, strategy, **kwargs)
+    except Exception as e:
+        logging.warning(f"{backend.name} backend failed for strategy {strategy}, falling back to pandas: {str(e)}")
+        return None
+
+@memoize_frame
 def clean(df, strategy=None, **kwargs):
     """
     Data cleaning function with separate strategies for specific cleaning tasks.
@@ -21,11 +35,23 @@ def clean(df, strategy=None, **kwargs):
         strategy (str): Cleaning operation ("remove_duplicates", "handle_missing", "fix_structural", "handle_outliers",
                         "convert_dtype", "encode_categorical", "scale", "filter", "split_column", "validate").
         kwargs: Additional parameters for specific strategies.
+                backend (str): Execution backend ('pandas', 'polars', 'arrow' or 'auto'). Defaults to the
+                               backend set with set_backend(). Strategies a backend does not implement,
+                               and backends that are not installed, fall back to pandas.
+                schema (dict): With strategy "validate", check every row against a declarative schema
+                               (see validate()) instead of clipping one column.
+                on_invalid (str): With a schema, 'raise' a DataValidationError (default) or 'drop' the invalid rows.
 
     Returns:
         pd.DataFrame: Cleaned DataFrame.
     """
     try:
+        backend = get_backend(kwargs.pop('backend', None))
+        result = _clean_with_backend(backend, df, strategy, kwargs)
+        if result is not None:
+            logging.info(f"Data cleaned successfully using strategy: {strategy} (backend: {backend.name})")
+            return result
+
         if strategy == 'remove_duplicates':
             initial_rows = len(df)
             df.drop_duplicates(inplace=True)
@@ -33,7 +59,7 @@ def clean(df, strategy=None, **kwargs):
             print(f"Removed {removed_rows} duplicate rows.")
 
         elif strategy == 'handle_missing':
-            missing_strategy = kwargs.get('strategy', 'mean')
+            missing_strategy = kwargs.get('missing_strategy', 'mean')
             value = kwargs.get('value', None)
             if missing_strategy == 'fill':
                 if isinstance(value, dict):
@@ -110,6 +136,18 @@ def clean(df, strategy=None, **kwargs):
                 df[new_columns] = df[column].str.split(delimiter, expand=True)
                 print(f"Split column {column} into {new_columns}.")
 
+        elif strategy == 'validate' and 'schema' in kwargs:
+            on_invalid = kwargs.get('on_invalid', 'raise')
+            if on_invalid not in ('raise', 'drop'):
+                raise ValueError("on_invalid must be 'raise' or 'drop'.")
+            if on_invalid == 'raise':
+                validate(df, kwargs['schema'], raise_on_error=True)
+                print("All rows satisfy the schema.")
+            else:
+                mask, _ = invalid_rows(df, kwargs['schema'])
+                df = df[~mask.to_numpy()]
+                print(f"Dropped {int(mask.sum())} rows that violate the schema.")
+
         elif strategy == 'validate':
             column = kwargs.get('column')
             min_value = kwargs.get('min_value', None)
@@ -124,6 +162,9 @@ def clean(df, strategy=None, **kwargs):
         logging.info(f"Data cleaned successfully using strategy: {strategy}")
         return df
 
+    except DataValidationError as e:
+        logging.error(str(e))
+        raise
     except Exception as e:
         logging.error(f"Data Cleaning Error: {str(e)}")
         raise Exception(f"Data Cleaning Error: {str(e)}")
@@ -0,0 +1,438 @@
+
+import os
+import bz2
+import gzip
+import lzma
+import logging
+from collections import deque
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from dataanalysts.exceptions import DataExportError
+
+# Logging Configuration
+logging.basicConfig(
+    level=logging.INFO,
+    filename='export.log',
+    filemode='a',
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+_FORMATS = {
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.feather': 'feather',
+    '.arrow': 'feather',
+    '.ipc': 'feather',
+    '.csv': 'csv'
+}
+
+_EXTENSIONS = {'parquet': '.parquet', 'feather': '.feather', 'csv': '.csv'}
+
+_DEFAULT_COMPRESSION = {'parquet': 'snappy', 'feather': 'lz4'}
+
+_CSV_OPENERS = {'gzip': gzip.open, 'bz2': bz2.open, 'xz': lzma.open}
+
+_CSV_SUFFIXES = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz'}
+
+# Directory name used for missing partition values, as in Hive, Spark and pyarrow datasets
+_NULL_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+
+# Rows held back while waiting for a value in columns that are still all-null
+_SCHEMA_HOLD_ROWS = 1000000
+
+def _infer_format(file_path):
+    root, extension = os.path.splitext(str(file_path).lower())
+    if extension in _CSV_SUFFIXES:
+        extension = os.path.splitext(root)[1]
+    return _FORMATS.get(extension)
+
+def _require_pyarrow(format):
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise DataExportError(f"❌ Export Error: {format} export requires pyarrow. Install it with 'pip install pyarrow'.")
+
+def _resolve_schema(tables):
+    """Schema of the first table, with all-null columns typed from the first table that has values."""
+    import pyarrow as pa
+
+    schema = tables[0].schema
+    for i, field in enumerate(schema):
+        if not pa.types.is_null(field.type):
+            continue
+        for table in tables[1:]:
+            index = table.schema.get_field_index(field.name)
+            if index >= 0 and not pa.types.is_null(table.schema.field(index).type):
+                schema = schema.set(i, field.with_type(table.schema.field(index).type))
+                break
+    return schema
+
+def _has_null_fields(schema):
+    import pyarrow as pa
+    return any(pa.types.is_null(field.type) for field in schema)
+
+def _partition_dir(partition_by, values):
+    parts = []
+    for column, value in zip(partition_by, values):
+        value = _NULL_PARTITION if pd.isna(value) else quote(str(value), safe='')
+        parts.append(f"{column}={value}")
+    return os.path.join(*parts)
+
+def _next_part_path(directory, extension):
+    """First unused part-NNNNN file name, so repeated exports add files next to existing ones."""
+    existing = set(os.listdir(directory)) if os.path.isdir(directory) else set()
+    i = 0
+    while f"part-{i:05d}{extension}" in existing:
+        i += 1
+    return os.path.join(directory, f"part-{i:05d}{extension}")
+
+class _FileWriter:
+    """
+    Incremental writer for a single output file.
+
+    Frames are cut into row groups that are converted to Arrow on the shared thread pool;
+    finished groups are written in order while later ones are still converting, so
+    conversion overlaps with encoding and compression. Without pyarrow, CSV output is
+    written directly with pandas.
+    """
+
+    def __init__(self, file_path, format, compression, row_group_size, pool, window, append, index, schema):
+        self.file_path = file_path
+        self.format = format
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.pool = pool
+        self.window = window
+        self.append = append
+        self.index = index
+        self.schema = schema
+        self.rows = 0
+        self.row_groups = 0
+        self._writer = None
+        self._sink = None
+        self._pending = deque()
+        self._held = []
+        self._held_rows = 0
+
+    def _to_arrow(self, df):
+        import pyarrow as pa
+
+        if self.format == 'csv' and self.index:
+            # Lay the index out as pandas does: leading columns named after the index levels
+            # ('' when unnamed), rather than pyarrow's trailing __index_level_N__ columns
+            index = pa.Table.from_pandas(df.index.to_frame(index=False), preserve_index=False)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            names = ['' if name is None else str(name) for name in df.index.names]
+            return pa.Table.from_arrays(index.columns + table.columns, names=names + table.column_names)
+        return pa.Table.from_pandas(df, preserve_index=self.index)
+
+    def _open(self, schema):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self.format == 'csv':
+            self._open_csv()
+            self.schema = schema
+            return
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self.append and os.path.exists(self.file_path):
+            raise ValueError(
+                f"Cannot append to existing {self.format} file '{self.file_path}'. "
+                "Write to a new file or use partition_by to add part files to a directory."
+            )
+        self.schema = schema
+        if self.format == 'parquet':
+            self._writer = pq.ParquetWriter(self.file_path, schema, compression=self.compression)
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=None if self.compression == 'none' else self.compression)
+            self._sink = pa.OSFile(self.file_path, 'wb')
+            self._writer = pa.ipc.new_file(self._sink, schema, options=options)
+
+    def _write_table(self, table):
+        if self._writer is None and self.schema is None:
+            # Hold tables back while some columns are all-null, so their type comes from the
+            # first chunk with values instead of being fixed to null by the first chunk
+            self._held.append(table)
+            self._held_rows += table.num_rows
+            if self._held_rows < _SCHEMA_HOLD_ROWS and _has_null_fields(_resolve_schema(self._held)):
+                return
+            self._release_held()
+            return
+        if self._writer is None:
+            self._open(self.schema)
+        self._append(table)
+
+    def _release_held(self):
+        held, self._held, self._held_rows = self._held, [], 0
+        if held:
+            self._open(_resolve_schema(held))
+            for table in held:
+                self._append(table)
+
+    def _append(self, table):
+        import pyarrow as pa
+
+        if not table.schema.equals(self.schema, check_metadata=False):
+            try:
+                table = table.select(self.schema.names).cast(self.schema)
+            except (KeyError, pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+                raise ValueError(
+                    f"Chunk does not match the output schema of '{self.file_path}' ({str(e)}). "
+                    "Pass schema= with the column types to write."
+                )
+        if table.num_rows == 0:
+            return
+        if self.format == 'csv':
+            import pyarrow.csv as pacsv
+            pacsv.write_csv(table, self._writer, write_options=pacsv.WriteOptions(include_header=self._header))
+            self._header = False
+        elif self.format == 'parquet':
+            self._writer.write_table(table, row_group_size=table.num_rows)
+        else:
+            self._writer.write_table(table)
+        self.rows += table.num_rows
+        self.row_groups += 1
+
+    def _open_csv(self):
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        exists = self.append and os.path.exists(self.file_path) and os.path.getsize(self.file_path) > 0
+        opener = _CSV_OPENERS.get(self.compression, open)
+        self._writer = opener(self.file_path, 'ab' if self.append else 'wb')
+        self._header = not exists
+
+    def _write_csv(self, df):
+        """pandas fallback for CSV output when pyarrow is not installed."""
+        if self._writer is None:
+            self._open_csv()
+        df.to_csv(self._writer, header=self._header, index=self.index)
+        self._header = False
+        self.rows += len(df)
+        self.row_groups += 1
+
+    def write(self, df, wait=True):
+        if self.pool is None:
+            self._write_csv(df)
+            return
+        if len(df) == 0:
+            self._pending.append(self.pool.submit(self._to_arrow, df))
+        for start in range(0, len(df), self.row_group_size):
+            self._pending.append(self.pool.submit(self._to_arrow, df.iloc[start:start + self.row_group_size]))
+            self.flush(keep=self.window)
+        if wait:
+            self.flush()
+
+    def flush(self, keep=0):
+        while len(self._pending) > keep:
+            self._write_table(self._pending.popleft().result())
+
+    def close(self, discard=False):
+        try:
+            if discard:
+                for future in self._pending:
+                    future.cancel()
+                self._pending.clear()
+                self._held = []
+            else:
+                self.flush()
+                self._release_held()
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+            if self._sink is not None:
+                self._sink.close()
+
+class ExportWriter:
+    """
+    Incremental writer for Parquet, Feather or CSV output, optionally partitioned by column values.
+
+    Each call to write() appends rows to the open output, so a stream of chunks can be
+    exported without ever holding the whole dataset in memory. Use it as a context manager
+    or call close() to finish the files.
+
+    Attributes:
+        file_path (str): Output file, or output directory when partition_by is given.
+        format (str): 'parquet', 'feather' or 'csv'.
+        rows (int): Number of rows written so far.
+        files (list): Paths of the files written.
+    """
+
+    def __init__(self, file_path, format=None, compression=None, partition_by=None,
+                 row_group_size=100000, workers=None, append=False, index=False, schema=None):
+        """
+        Parameters:
+            file_path (str): Output file, or output directory when partition_by is given.
+            format (str): 'parquet', 'feather' or 'csv'. Inferred from the file extension if None
+                          (defaults to 'parquet' for partitioned output).
+            compression (str): Codec, e.g. 'snappy', 'zstd', 'gzip' (Parquet), 'lz4', 'zstd' (Feather),
+                               'gzip', 'bz2', 'xz' (CSV), or 'none'. If None, Parquet uses snappy,
+                               Feather uses lz4 and CSV is inferred from the file suffix.
+            partition_by (str/list): Columns whose values split the output into col=value directories.
+            row_group_size (int): Maximum number of rows per Parquet row group / Feather record batch.
+            workers (int): Threads converting row groups to Arrow in parallel. Defaults to min(4, CPU count).
+            append (bool): Append rows to an existing CSV file instead of overwriting it. Parquet and
+                           Feather files cannot be reopened for appending; partitioned exports always
+                           add new part files next to existing ones.
+            index (bool): Whether to write the DataFrame index.
+            schema (pyarrow.Schema): Schema for Parquet/Feather output. Defaults to the schema of the first chunk,
+                                     with all-null columns typed from the first chunk that has values.
+        """
+        try:
+            format = format or _infer_format(file_path) or ('parquet' if partition_by else None)
+            if format not in _EXTENSIONS:
+                raise ValueError(f"Unsupported export format '{format}'. Choose 'parquet', 'feather' or 'csv'.")
+            pool = True
+            if format == 'csv':
+                try:
+                    import pyarrow  # noqa: F401
+                except ImportError:
+                    pool = False
+                if compression is None:
+                    compression = _CSV_SUFFIXES.get(os.path.splitext(str(file_path).lower())[1])
+                elif compression != 'none' and compression not in _CSV_OPENERS:
+                    raise ValueError(f"Unsupported CSV compression '{compression}'. Choose 'gzip', 'bz2', 'xz' or 'none'.")
+            else:
+                _require_pyarrow(format)
+                compression = compression or _DEFAULT_COMPRESSION[format]
+
+            self.file_path = str(file_path)
+            self.format = format
+            self.compression = compression
+            self.partition_by = [partition_by] if isinstance(partition_by, str) else partition_by
+            self.row_group_size = row_group_size
+            self.workers = workers or min(4, os.cpu_count() or 1)
+            self.append = append
+            self.index = index
+            self.schema = schema
+            self._pool = ThreadPoolExecutor(self.workers) if pool else None
+            self._files = {}
+            self._closed = False
+        except DataExportError:
+            raise
+        except Exception as e:
+            logging.error(f"❌ Export Error: {str(e)}")
+            raise DataExportError(f"❌ Export Error: {str(e)}")
+
+    def _file(self, key):
+        if key not in self._files:
+            if self.partition_by:
+                directory = os.path.join(self.file_path, _partition_dir(self.partition_by, key))
+                path = _next_part_path(directory, _EXTENSIONS[self.format])
+                append = False
+            else:
+                path, append = self.file_path, self.append
+            self._files[key] = _FileWriter(
+                path, self.format, self.compression, self.row_group_size,
+                self._pool, self.workers, append, self.index, self.schema
+            )
+        return self._files[key]
+
+    def _write(self, df, wait):
+        if self._closed:
+            raise ValueError("The writer is already closed.")
+        if not self.partition_by:
+            self._file(()).write(df, wait=wait)
+            return
+        missing = [column for column in self.partition_by if column not in df.columns]
+        if missing:
+            raise KeyError(f"Partition columns not found: {missing}")
+        for key, group in df.groupby(self.partition_by, sort=False, dropna=False):
+            key = key if isinstance(key, tuple) else (key,)
+            self._file(key).write(group.drop(columns=self.partition_by), wait=wait)
+
+    def write(self, df):
+        """
+        Append a DataFrame to the output.
+
+        Parameters:
+            df (pd.DataFrame): Rows to write. Every chunk must have the same columns.
+        """
+        try:
+            self._write(df, wait=True)
+        except Exception as e:
+            logging.error(f"❌ Export Error: {str(e)}")
+            raise DataExportError(f"❌ Export Error: {str(e)}")
+
+    @property
+    def rows(self):
+        return sum(writer.rows for writer in self._files.values())
+
+    @property
+    def files(self):
+        return [writer.file_path for writer in self._files.values()]
+
+    def close(self, discard=False):
+        """Write any pending row groups and close every output file."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            for writer in self._files.values():
+                writer.close(discard=discard)
+        except Exception as e:
+            logging.error(f"❌ Export Error: {str(e)}")
+            raise DataExportError(f"❌ Export Error: {str(e)}")
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close(discard=exc_type is not None)
+        return False
+
+def export(data, file_path, format=None, compression=None, partition_by=None,
+           row_group_size=100000, workers=None, append=False, index=False, schema=None):
+    """
+    Write a DataFrame or a stream of DataFrame chunks to Parquet, Feather or CSV.
+
+    Chunks are written incrementally as they arrive, and row groups of Parquet/Feather output
+    are converted to Arrow in parallel while earlier groups are encoded and written.
+
+    Parameters:
+        data (pd.DataFrame or iterable): A DataFrame, or an iterable of chunks (e.g. from csv_chunks).
+        file_path (str): Output file, or output directory when partition_by is given.
+        format (str): 'parquet', 'feather' or 'csv'. Inferred from the file extension if None.
+        compression (str): Compression codec, or 'none'. Defaults to snappy (Parquet), lz4 (Feather)
+                           or the file suffix (CSV, e.g. '.csv.gz').
+        partition_by (str/list): Columns whose values split the output into col=value directories.
+        row_group_size (int): Maximum number of rows per row group / record batch.
+        workers (int): Threads used for row-group conversion.
+        append (bool): Append to an existing CSV file instead of overwriting it.
+        index (bool): Whether to write the DataFrame index.
+        schema (pyarrow.Schema): Schema for Parquet/Feather output. Defaults to the schema of the first chunk,
+                                 with all-null columns typed from the first chunk that has values.
+
+    Returns:
+        dict: {'rows': rows written, 'row_groups': row groups written, 'files': list of file paths}.
+    """
+    writer = ExportWriter(
+        file_path, format=format, compression=compression, partition_by=partition_by,
+        row_group_size=row_group_size, workers=workers, append=append, index=index, schema=schema
+    )
+    try:
+        with writer:
+            chunks = [data] if isinstance(data, pd.DataFrame) else data
+            for chunk in chunks:
+                # The stream owns its chunks, so conversion can run ahead of the writes
+                writer._write(chunk, wait=False)
+    except DataExportError:
+        raise
+    except Exception as e:
+        logging.error(f"❌ Export Error: {str(e)}")
+        raise DataExportError(f"❌ Export Error: {str(e)}")
+
+    result = {
+        'rows': writer.rows,
+        'row_groups': sum(file_writer.row_groups for file_writer in writer._files.values()),
+        'files': writer.files
+    }
+    logging.info(f"✅ Exported {result['rows']} rows to {len(result['files'])} {writer.format} files at '{file_path}'.")
+    print(f"✅ Exported {result['rows']} rows to {len(result['files'])} {writer.format} files at '{file_path}'.")
+    return result
@@ -0,0 +1,351 @@
+
+import os
+import time
+import shutil
+import tempfile
+import itertools
+import logging
+import numpy as np
+import pandas as pd
+from pandas.api import types
+from dataanalysts.exceptions import DataIntegrationError
+
+# Logging Configuration
+logging.basicConfig(
+    level=logging.INFO,
+    filename='integrate.log',
+    filemode='a',
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+_STRATEGIES = ('auto', 'broadcast', 'sort_merge', 'partitioned')
+
+_HOWS = ('inner', 'left', 'right', 'outer')
+
+# Inputs up to this size are held in memory and can be broadcast to the other side
+_DEFAULT_MEMORY_LIMIT = 256 * 1024 ** 2
+
+_DEFAULT_PARTITIONS = 32
+
+# Temporary column marking build-side rows, used to emit unmatched rows of outer joins
+_ROW = '__dataanalysts_row__'
+
+def _frame_bytes(df):
+    return int(df.memory_usage(deep=True).sum())
+
+class _Side:
+    """
+    One join input: a DataFrame, or a stream of chunks read ahead up to memory_limit.
+
+    A stream that ends within the limit is concatenated and treated like a DataFrame;
+    otherwise the chunks read so far are replayed in front of the rest of the stream.
+    """
+
+    def __init__(self, data, name, memory_limit):
+        self.name = name
+        self.rows = 0
+        if isinstance(data, pd.DataFrame):
+            self.frame = data
+            self.nbytes = _frame_bytes(data)
+            self.template = data.iloc[:0]
+            self._chunks = None
+            return
+
+        iterator = iter(data)
+        buffered = []
+        self.nbytes = 0
+        for chunk in iterator:
+            buffered.append(chunk)
+            self.nbytes += _frame_bytes(chunk)
+            if self.nbytes > memory_limit:
+                break
+        if not buffered:
+            raise ValueError(f"The {name} input has no chunks.")
+        self.template = buffered[0].iloc[:0]
+        if self.nbytes > memory_limit:
+            self.frame = None
+            self._chunks = itertools.chain(buffered, iterator)
+        else:
+            self.frame = pd.concat(buffered, ignore_index=True) if len(buffered) > 1 else buffered[0]
+            self._chunks = None
+
+    @property
+    def in_memory(self):
+        return self.frame is not None
+
+    def chunks(self):
+        """Iterate over the input once, counting rows."""
+        for chunk in ([self.frame] if self.in_memory else self._chunks):
+            self.rows += len(chunk)
+            yield chunk
+
+def _keys(on, left_on, right_on):
+    if on is not None:
+        on = [on] if isinstance(on, str) else list(on)
+        return on, on
+    if left_on is None or right_on is None:
+        raise ValueError("Provide either 'on' or both 'left_on' and 'right_on'.")
+    left_on = [left_on] if isinstance(left_on, str) else list(left_on)
+    right_on = [right_on] if isinstance(right_on, str) else list(right_on)
+    if len(left_on) != len(right_on):
+        raise ValueError("'left_on' and 'right_on' must have the same number of columns.")
+    return left_on, right_on
+
+def _broadcast(probe, build, probe_is_left, how, merge_kwargs):
+    """
+    Hash join that keeps the build side in memory and streams the probe side past it.
+
+    Build rows that never match are emitted at the end when the join keeps them.
+    """
+    keep_probe = how in ('outer', 'left' if probe_is_left else 'right')
+    keep_build = how in ('outer', 'right' if probe_is_left else 'left')
+    table = build.frame
+    if keep_build:
+        table = table.assign(**{_ROW: np.arange(len(table))})
+        matched = np.zeros(len(table), dtype=bool)
+
+    chunk_how = ('left' if probe_is_left else 'right') if keep_probe else 'inner'
+    for chunk in probe.chunks():
+        pair = (chunk, table) if probe_is_left else (table, chunk)
+        result = pd.merge(*pair, how=chunk_how, **merge_kwargs)
+        if keep_build:
+            matched[result[_ROW].dropna().to_numpy(dtype=np.int64)] = True
+            result = result.drop(columns=_ROW)
+        yield result
+
+    if keep_build and not matched.all():
+        unmatched = table[~matched].drop(columns=_ROW)
+        pair = (probe.template, unmatched) if probe_is_left else (unmatched, probe.template)
+        yield pd.merge(*pair, how='right' if probe_is_left else 'left', **merge_kwargs)
+
+def _sorted_chunks(side, key):
+    """Yield the chunks of a side, checking that the key is sorted ascending across chunks."""
+    last = None
+    for chunk in side.chunks():
+        if len(chunk) == 0:
+            continue
+        values = chunk[key]
+        if not values.is_monotonic_increasing or (last is not None and values.iloc[0] < last):
+            raise ValueError(f"The {side.name} input is not sorted by '{key}'. Sort it or use strategy='partitioned'.")
+        last = values.iloc[-1]
+        yield chunk
+
+def _sort_merge(left, right, left_key, right_key, how, merge_kwargs):
+    """
+    Merge join of two inputs sorted by a single key, holding only a window of each in memory.
+
+    Rows with keys below the smaller of the two buffered maxima are complete on both sides,
+    so they are joined and released before more chunks are read.
+    """
+    streams = [_sorted_chunks(left, left_key), _sorted_chunks(right, right_key)]
+    keys = [left_key, right_key]
+    buffers = [left.template, right.template]
+    done = [False, False]
+
+    def pull(i):
+        chunk = next(streams[i], None)
+        if chunk is None:
+            done[i] = True
+        else:
+            buffers[i] = pd.concat([buffers[i], chunk], ignore_index=True) if len(buffers[i]) else chunk
+
+    while True:
+        for i in (0, 1):
+            while not done[i] and len(buffers[i]) == 0:
+                pull(i)
+        limits = [buffers[i][keys[i]].iloc[-1] for i in (0, 1) if not done[i]]
+        if not limits:
+            break
+        boundary = min(limits)
+        ready = [buffers[i][keys[i]] < boundary for i in (0, 1)]
+        if ready[0].any() or ready[1].any():
+            yield pd.merge(buffers[0][ready[0]], buffers[1][ready[1]], how=how, **merge_kwargs)
+            buffers = [buffers[i][~ready[i]] for i in (0, 1)]
+        # Every side whose buffer ends at the boundary needs more rows before it can advance
+        for i in (0, 1):
+            if not done[i] and buffers[i][keys[i]].iloc[-1] == boundary:
+                pull(i)
+
+    if len(buffers[0]) or len(buffers[1]):
+        yield pd.merge(buffers[0], buffers[1], how=how, **merge_kwargs)
+
+def _partition_ids(chunk, keys, partitions):
+    # Hash numeric keys as float64 so that e.g. int64 and float64 keys that pandas would
+    # match land in the same partition
+    key_frame = pd.DataFrame({
+        i: chunk[key].astype(np.float64)
+        if types.is_numeric_dtype(chunk[key].dtype) and not types.is_bool_dtype(chunk[key].dtype) else chunk[key]
+        for i, key in enumerate(keys)
+    })
+    return pd.util.hash_pandas_object(key_frame, index=False).to_numpy() % partitions
+
+def _partitioned(left, right, left_keys, right_keys, how, merge_kwargs, partitions, spill_dir, stats):
+    """
+    Out-of-core hash join: both sides are hash-partitioned by key into spill files, then
+    each pair of partitions is joined in memory. Equal keys always share a partition.
+    """
+    workdir = tempfile.mkdtemp(prefix='dataanalysts-join-', dir=spill_dir)
+    try:
+        for side, keys in ((left, left_keys), (right, right_keys)):
+            for n, chunk in enumerate(side.chunks()):
+                ids = _partition_ids(chunk, keys, partitions)
+                order = np.argsort(ids, kind='stable')
+                bounds = np.searchsorted(ids[order], np.arange(partitions + 1))
+                for p in range(partitions):
+                    if bounds[p] == bounds[p + 1]:
+                        continue
+                    path = os.path.join(workdir, f"{side.name}-{p:05d}-{n:06d}.pkl")
+                    chunk.take(order[bounds[p]:bounds[p + 1]]).to_pickle(path)
+                    stats['spilled_bytes'] += os.path.getsize(path)
+
+        files = sorted(os.listdir(workdir))
+        for p in range(partitions):
+            parts = []
+            for side in (left, right):
+                prefix = f"{side.name}-{p:05d}-"
+                frames = [pd.read_pickle(os.path.join(workdir, name)) for name in files if name.startswith(prefix)]
+                parts.append(pd.concat(frames, ignore_index=True) if frames else side.template)
+            if len(parts[0]) or len(parts[1]):
+                yield pd.merge(parts[0], parts[1], how=how, **merge_kwargs)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+def _choose(strategy, left, right, left_keys, presorted):
+    if strategy != 'auto':
+        return strategy
+    if left.in_memory or right.in_memory:
+        return 'broadcast'
+    if presorted and len(left_keys) == 1:
+        return 'sort_merge'
+    return 'partitioned'
+
+def merge_chunks(left, right, on=None, left_on=None, right_on=None, how='inner', strategy='auto',
+                 memory_limit=_DEFAULT_MEMORY_LIMIT, presorted=False, partitions=None, spill_dir=None,
+                 suffixes=('_x', '_y'), stats=None):
+    """
+    Join two DataFrames or chunk streams, yielding the result one chunk at a time.
+
+    With strategy='auto' the join method is picked from the input sizes:
+      - broadcast: one side fits within memory_limit; it is kept in a hash table and the
+        other side is streamed past it.
+      - sort_merge: both sides are larger, presorted=True and there is a single key; only
+        a window of each sorted input is held in memory.
+      - partitioned: otherwise, both sides are hash-partitioned into spill files on disk
+        and each partition is joined in memory.
+
+    Parameters:
+        left (pd.DataFrame or iterable): Left input, or an iterable of chunks (e.g. from csv_chunks).
+        right (pd.DataFrame or iterable): Right input, or an iterable of chunks.
+        on (str/list): Key columns present in both inputs.
+        left_on (str/list): Key columns of the left input, if named differently.
+        right_on (str/list): Key columns of the right input, if named differently.
+        how (str): 'inner', 'left', 'right' or 'outer'.
+        strategy (str): 'auto', 'broadcast', 'sort_merge' or 'partitioned'.
+        memory_limit (int): Largest input size in bytes that is held in memory.
+        presorted (bool): Both inputs are sorted ascending by the key, so 'auto' may use sort_merge.
+        partitions (int): Number of spill partitions for the partitioned join (default: 32).
+        spill_dir (str): Directory for spill files. Defaults to the system temporary directory.
+        suffixes (tuple): Suffixes for overlapping non-key columns, as in pd.merge.
+        stats (dict): If given, filled with join statistics when the iteration finishes.
+
+    Yields:
+        pd.DataFrame: Chunks of the joined result. Row order may differ from pd.merge.
+    """
+    try:
+        if how not in _HOWS:
+            raise ValueError(f"Unsupported join type '{how}'. Choose one of {_HOWS}.")
+        if strategy not in _STRATEGIES:
+            raise ValueError(f"Unknown join strategy '{strategy}'. Choose one of {_STRATEGIES}.")
+        left_keys, right_keys = _keys(on, left_on, right_on)
+        merge_kwargs = {'suffixes': suffixes}
+        if on is not None:
+            merge_kwargs['on'] = on
+        else:
+            merge_kwargs.update({'left_on': left_on, 'right_on': right_on})
+
+        start = time.perf_counter()
+        left_side = _Side(left, 'left', memory_limit)
+        right_side = _Side(right, 'right', memory_limit)
+        chosen = _choose(strategy, left_side, right_side, left_keys, presorted)
+        report = {
+            'strategy': chosen,
+            'how': how,
+            'left_rows': 0,
+            'right_rows': 0,
+            'output_rows': 0,
+            'output_chunks': 0,
+            'build_side': None,
+            'partitions': None,
+            'spilled_bytes': 0,
+            'seconds': 0.0
+        }
+
+        if chosen == 'broadcast':
+            candidates = [side for side in (left_side, right_side) if side.in_memory]
+            if not candidates:
+                raise ValueError("Broadcast join needs one input within memory_limit; use 'sort_merge' or 'partitioned'.")
+            build = min(candidates, key=lambda side: side.nbytes)
+            probe = right_side if build is left_side else left_side
+            report['build_side'] = build.name
+            results = _broadcast(probe, build, probe is left_side, how, merge_kwargs)
+        elif chosen == 'sort_merge':
+            if len(left_keys) != 1:
+                raise ValueError("Sort-merge join supports a single key column.")
+            results = _sort_merge(left_side, right_side, left_keys[0], right_keys[0], how, merge_kwargs)
+        else:
+            report['partitions'] = partitions or _DEFAULT_PARTITIONS
+            results = _partitioned(left_side, right_side, left_keys, right_keys, how, merge_kwargs,
+                                   report['partitions'], spill_dir, report)
+
+        empty = None
+        for result in results:
+            if len(result) == 0:
+                empty = result
+                continue
+            report['output_rows'] += len(result)
+            report['output_chunks'] += 1
+            yield result
+        if report['output_chunks'] == 0 and empty is not None:
+            # Keep the joined columns even when nothing matched
+            yield empty
+
+        # The build side of a broadcast join is never iterated, so count its rows here
+        report['left_rows'] = left_side.rows or (len(left_side.frame) if left_side.in_memory else 0)
+        report['right_rows'] = right_side.rows or (len(right_side.frame) if right_side.in_memory else 0)
+        report['seconds'] = time.perf_counter() - start
+        if stats is not None:
+            stats.update(report)
+        logging.info(f"Join completed: {report}")
+    except Exception as e:
+        logging.error(f"Data Integration Error: {str(e)}")
+        raise DataIntegrationError(f"Data Integration Error: {str(e)}")
+
+def merge(left, right, on=None, left_on=None, right_on=None, how='inner', strategy='auto',
+          memory_limit=_DEFAULT_MEMORY_LIMIT, presorted=False, partitions=None, spill_dir=None,
+          suffixes=('_x', '_y'), return_stats=False):
+    """
+    Join two DataFrames or chunk streams into a single DataFrame.
+
+    The join method is picked as in merge_chunks(). Use merge_chunks() (for example together
+    with export()) when the joined result itself does not fit in memory.
+
+    Parameters:
+        left, right, on, left_on, right_on, how, strategy, memory_limit, presorted, partitions,
+        spill_dir, suffixes: As in merge_chunks().
+        return_stats (bool): Also return the join statistics.
+
+    Returns:
+        pd.DataFrame: Joined data, or (pd.DataFrame, dict) when return_stats is True. The
+                      statistics contain strategy, how, left_rows, right_rows, output_rows,
+                      output_chunks, build_side, partitions, spilled_bytes and seconds.
+    """
+    stats = {}
+    chunks = list(merge_chunks(
+        left, right, on=on, left_on=left_on, right_on=right_on, how=how, strategy=strategy,
+        memory_limit=memory_limit, presorted=presorted, partitions=partitions, spill_dir=spill_dir,
+        suffixes=suffixes, stats=stats
+    ))
+    result = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+    print(f"✅ Joined {stats['left_rows']} and {stats['right_rows']} rows into {stats['output_rows']} rows "
+          f"using a {stats['strategy']} join.")
+    return (result, stats) if return_stats else result
@@ -1,3 +1,7 @@
+import os
+import asyncio
+import functools
+import contextvars
 import pandas as pd
 import logging
 from dataanalysts.exceptions import DataLoadingError
@@ -49,3 +53,219 @@ def excel(file_path, sheet_name=0):
     except Exception as e:
         logging.error(f"❌ Excel Loading Error: {str(e)}")
         raise DataLoadingError(f"❌ Excel Loading Error: {str(e)}")
+
+
+def csv_chunks(file_path, chunksize=100000, **kwargs):
+    """
+    Load data from a CSV file lazily, one chunk of rows at a time.
+
+    Parameters:
+        file_path (str): Path to the CSV file.
+        chunksize (int): Number of rows per chunk.
+        kwargs: Additional keyword arguments passed to pd.read_csv.
+
+    Yields:
+        pd.DataFrame: Consecutive chunks of the file.
+    """
+    try:
+        reader = pd.read_csv(file_path, chunksize=chunksize, **kwargs)
+        n_chunks = 0
+        with reader:
+            for chunk in reader:
+                n_chunks += 1
+                yield chunk
+        logging.info(f"✅ CSV file '{file_path}' streamed successfully in {n_chunks} chunks.")
+    except Exception as e:
+        logging.error(f"❌ CSV Chunk Loading Error: {str(e)}")
+        raise DataLoadingError(f"❌ CSV Chunk Loading Error: {str(e)}")
+
+
+# Concurrency slot (an acquired semaphore) held by the current load_many_async task; it is
+# handed to the next executor call and released only when that call has really finished.
+_SLOT = contextvars.ContextVar('_SLOT', default=None)
+
+
+def _finished(future, slot):
+    if slot is not None:
+        slot.release()
+    # Retrieve the outcome of abandoned calls so asyncio does not warn about it
+    if not future.cancelled():
+        future.exception()
+
+
+async def _in_executor(func, *args, timeout=None, executor=None, **kwargs):
+    """
+    Run a blocking call in an executor so the event loop stays responsive.
+
+    A timeout or cancellation stops waiting for the call, but the call itself keeps running
+    in its worker until it finishes.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+    slot = _SLOT.get()
+    _SLOT.set(None)
+    future.add_done_callback(functools.partial(_finished, slot=slot))
+    # shield keeps wait_for from cancelling the executor future, so the done-callback runs
+    # when the parse has actually ended rather than when the caller gave up on it
+    return await asyncio.wait_for(asyncio.shield(future), timeout)
+
+
+async def csv_async(file_path, timeout=None, executor=None, **kwargs):
+    """
+    Load data from a CSV file without blocking the event loop.
+
+    Parameters:
+        file_path (str): Path to the CSV file.
+        timeout (float): Seconds to wait before giving up, or None to wait indefinitely. A timeout
+                         stops waiting, but does not stop the parse already running in the executor.
+        executor (concurrent.futures.Executor): Executor that runs the parse. Defaults to the loop's thread pool.
+        kwargs: Additional keyword arguments passed to pd.read_csv.
+
+    Returns:
+        pd.DataFrame: Loaded data as a DataFrame.
+    """
+    try:
+        df = await _in_executor(pd.read_csv, file_path, timeout=timeout, executor=executor, **kwargs)
+        logging.info(f"✅ CSV file '{file_path}' loaded successfully.")
+        print(f"✅ CSV file '{file_path}' loaded successfully.")
+        return df
+    except asyncio.TimeoutError:
+        logging.error(f"❌ CSV Loading Error: '{file_path}' timed out after {timeout} seconds.")
+        raise DataLoadingError(f"❌ CSV Loading Error: '{file_path}' timed out after {timeout} seconds.")
+    except Exception as e:
+        logging.error(f"❌ CSV Loading Error: {str(e)}")
+        raise DataLoadingError(f"❌ CSV Loading Error: {str(e)}")
+
+
+async def excel_async(file_path, sheet_name=0, timeout=None, executor=None, **kwargs):
+    """
+    Load data from an Excel file without blocking the event loop.
+
+    Parameters:
+        file_path (str): Path to the Excel file.
+        sheet_name (str/int): Sheet name or index.
+        timeout (float): Seconds to wait before giving up, or None to wait indefinitely. A timeout
+                         stops waiting, but does not stop the parse already running in the executor.
+        executor (concurrent.futures.Executor): Executor that runs the parse. Defaults to the loop's thread pool.
+        kwargs: Additional keyword arguments passed to pd.read_excel.
+
+    Returns:
+        pd.DataFrame: Loaded data as a DataFrame.
+    """
+    try:
+        df = await _in_executor(
+            pd.read_excel, file_path, timeout=timeout, executor=executor, sheet_name=sheet_name, **kwargs
+        )
+        logging.info(f"✅ Excel file '{file_path}' loaded successfully from sheet '{sheet_name}'.")
+        print(f"✅ Excel file '{file_path}' loaded successfully from sheet '{sheet_name}'.")
+        return df
+    except asyncio.TimeoutError:
+        logging.error(f"❌ Excel Loading Error: '{file_path}' timed out after {timeout} seconds.")
+        raise DataLoadingError(f"❌ Excel Loading Error: '{file_path}' timed out after {timeout} seconds.")
+    except Exception as e:
+        logging.error(f"❌ Excel Loading Error: {str(e)}")
+        raise DataLoadingError(f"❌ Excel Loading Error: {str(e)}")
+
+
+async def csv_chunks_async(file_path, chunksize=100000, executor=None, **kwargs):
+    """
+    Load data from a CSV file lazily in an async for loop, one chunk of rows at a time.
+
+    The next chunk is read and parsed in the executor while the caller works on the
+    current one, so file I/O and parsing overlap with the caller's processing.
+
+    Parameters:
+        file_path (str): Path to the CSV file.
+        chunksize (int): Number of rows per chunk.
+        executor (concurrent.futures.Executor): Executor that runs the parse. Defaults to the loop's thread pool.
+        kwargs: Additional keyword arguments passed to pd.read_csv.
+
+    Yields:
+        pd.DataFrame: Consecutive chunks of the file.
+    """
+    loop = asyncio.get_running_loop()
+    pending = None
+    reader = None
+    try:
+        reader = await _in_executor(pd.read_csv, file_path, executor=executor, chunksize=chunksize, **kwargs)
+        n_chunks = 0
+        pending = loop.run_in_executor(executor, next, reader, None)
+        while True:
+            chunk = await pending
+            pending = None
+            if chunk is None:
+                break
+            # Prefetch the next chunk before handing this one to the caller
+            pending = loop.run_in_executor(executor, next, reader, None)
+            n_chunks += 1
+            yield chunk
+        logging.info(f"✅ CSV file '{file_path}' streamed successfully in {n_chunks} chunks.")
+    except Exception as e:
+        logging.error(f"❌ CSV Chunk Loading Error: {str(e)}")
+        raise DataLoadingError(f"❌ CSV Chunk Loading Error: {str(e)}")
+    finally:
+        if reader is not None:
+            if pending is not None and not pending.done():
+                # A read is still running in the executor; close the file once it finishes
+                pending.add_done_callback(lambda _: reader.close())
+            else:
+                reader.close()
+
+
+_ASYNC_LOADERS = {
+    '.csv': csv_async,
+    '.xlsx': excel_async,
+    '.xls': excel_async
+}
+
+
+async def load_many_async(file_paths, max_concurrency=4, timeout=None, return_exceptions=False, executor=None, **kwargs):
+    """
+    Load many CSV/Excel files concurrently, with at most max_concurrency parses in flight.
+
+    Parameters:
+        file_paths (list): Paths to load. The loader is chosen by file extension (.csv, .xlsx, .xls).
+        max_concurrency (int): Maximum number of files loaded at the same time. A file's slot is freed
+                               only when its parse has finished, even after a timeout or cancellation.
+        timeout (float): Per-file timeout in seconds, or None to wait indefinitely. A timed-out parse
+                         is not interrupted; it keeps running (and holding its slot) until it ends.
+        return_exceptions (bool): If True, a failed file maps to its DataLoadingError instead of
+                                  cancelling the remaining loads and raising.
+        executor (concurrent.futures.Executor): Executor that runs the parses. Defaults to the loop's thread pool.
+        kwargs: Additional keyword arguments passed to every loader.
+
+    Returns:
+        dict: Maps each file path to its DataFrame (or DataLoadingError), in the order given.
+    """
+    file_paths = list(file_paths)
+    for file_path in file_paths:
+        extension = os.path.splitext(str(file_path))[1].lower()
+        if extension not in _ASYNC_LOADERS:
+            logging.error(f"❌ Loading Error: Unsupported file type '{extension}' for '{file_path}'.")
+            raise DataLoadingError(f"❌ Loading Error: Unsupported file type '{extension}' for '{file_path}'.")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def load_one(file_path):
+        loader = _ASYNC_LOADERS[os.path.splitext(str(file_path))[1].lower()]
+        await semaphore.acquire()
+        _SLOT.set(semaphore)
+        try:
+            return await loader(file_path, timeout=timeout, executor=executor, **kwargs)
+        finally:
+            # The slot is still ours only if the parse never reached the executor
+            if _SLOT.get() is semaphore:
+                _SLOT.set(None)
+                semaphore.release()
+
+    tasks = [asyncio.ensure_future(load_one(file_path)) for file_path in file_paths]
+    try:
+        results = await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    finally:
+        # On the first failure (or if the caller is cancelled) stop the loads still queued
+        for task in tasks:
+            task.cancel()
+
+    logging.info(f"✅ {len(file_paths)} files loaded with max_concurrency={max_concurrency}.")
+    print(f"✅ {len(file_paths)} files loaded with max_concurrency={max_concurrency}.")
+    return dict(zip(file_paths, results))
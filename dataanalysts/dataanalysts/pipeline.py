@@ -0,0 +1,246 @@
+
+import os
+import json
+import time
+import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from dataanalysts import load
+from dataanalysts.cache import make_key
+from dataanalysts.cleaner import clean
+from dataanalysts.transformer import transform
+from dataanalysts.summary import summary
+from dataanalysts.validation import validate
+from dataanalysts.export import export
+from dataanalysts.visualizer import _PLOTS, set_headless
+from dataanalysts.exceptions import DataProcessingError
+
+# Logging Configuration
+logging.basicConfig(
+    level=logging.INFO,
+    filename='pipeline.log',
+    filemode='a',
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+_STAGES = ('load', 'clean', 'transform', 'validate', 'summary', 'plot', 'export')
+
+# Stages that produce a new frame and therefore a new checkpoint
+_FRAME_STAGES = ('load', 'clean', 'transform')
+
+_MANIFEST = 'manifest.json'
+
+def _check_steps(steps):
+    steps = [dict(step) for step in steps]
+    if not steps or steps[0].get('stage') != 'load':
+        steps.insert(0, {'stage': 'load'})
+    for i, step in enumerate(steps):
+        if step.get('stage') not in _STAGES:
+            raise ValueError(f"Step {i} has unknown stage '{step.get('stage')}'. Choose from: {', '.join(_STAGES)}.")
+        if step['stage'] == 'load' and i > 0:
+            raise ValueError("Only the first step can be a 'load' stage.")
+        if step['stage'] == 'plot' and step.get('kind') not in _PLOTS:
+            raise ValueError(f"Step {i} has unknown chart kind '{step.get('kind')}'. Choose from: {', '.join(_PLOTS)}.")
+    return steps
+
+def _run_name(file_path):
+    """Directory name for one input: its file stem plus a short hash of the full path."""
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    return f"{stem}-{hashlib.blake2b(os.path.abspath(file_path).encode(), digest_size=4).hexdigest()}"
+
+def _step_keys(file_path, steps):
+    """
+    One key per step, chained over the input file and every earlier step, so editing a step
+    (or replacing the input file) invalidates that step and everything after it.
+    """
+    stat = os.stat(file_path)
+    key = make_key(os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+    keys = []
+    for step in steps:
+        key = make_key(key, json.dumps(step, sort_keys=True, default=str))
+        keys.append(key)
+    return keys
+
+def _read_manifest(run_dir):
+    try:
+        with open(os.path.join(run_dir, _MANIFEST)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_manifest(run_dir, manifest):
+    # Write then rename, so a crash never leaves a half-written manifest behind
+    path = os.path.join(run_dir, _MANIFEST)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_path, path)
+
+def _write_checkpoint(df, path):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    df.to_parquet(temp_path)
+    os.replace(temp_path, path)
+
+def _resume_point(manifest, keys):
+    """Index of the last completed step whose key still matches, and its manifest entry."""
+    if not manifest:
+        return -1, None
+    last, entry = -1, None
+    for i, completed in enumerate(manifest.get('completed', [])):
+        if i >= len(keys) or completed.get('key') != keys[i] or not os.path.exists(completed['checkpoint']):
+            break
+        last, entry = i, completed
+    return last, entry
+
+def _load(file_path, options):
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension in ('.xls', '.xlsx'):
+        return load.excel(file_path, sheet_name=options.get('sheet_name', 0))
+    if extension in ('.parquet', '.pq'):
+        return pd.read_parquet(file_path)
+    if extension in ('.feather', '.arrow'):
+        return pd.read_feather(file_path)
+    return load.csv(file_path)
+
+def _run_step(df, step, index, file_path, artifact_dir):
+    """Run one step. Returns the (possibly new) frame and the paths of any files it wrote."""
+    options = {key: value for key, value in step.items() if key != 'stage'}
+    stage = step['stage']
+    if stage == 'load':
+        return _load(file_path, options), []
+    if stage == 'clean':
+        return clean(df, **options), []
+    if stage == 'transform':
+        return transform(df, **options), []
+    if stage == 'validate':
+        validate(df, options.pop('schema'), raise_on_error=True, **options)
+        return df, []
+
+    os.makedirs(artifact_dir, exist_ok=True)
+    if stage == 'summary':
+        path = os.path.join(artifact_dir, options.get('filename', f"{index:02d}_summary.csv"))
+        summary(df).to_csv(path, index=False)
+        return df, [path]
+    if stage == 'plot':
+        kind = options.pop('kind')
+        output = options.pop('output', 'png')
+        path = os.path.join(artifact_dir, options.pop('filename', f"{index:02d}_{kind}.{output}"))
+        _PLOTS[kind](df, output=output, save_path=path, **options)
+        return df, [path]
+    # export
+    format = options.pop('format', 'parquet')
+    path = os.path.join(artifact_dir, options.pop('filename', f"{index:02d}_export.{format}"))
+    return df, export(df, path, format=format, **options)['files']
+
+def _run_one(task):
+    """Run every step for one input file, resuming from its last valid checkpoint."""
+    file_path, steps, checkpoint_dir, output_dir, resume = task
+    start = time.perf_counter()
+    name = _run_name(file_path)
+    run_dir = os.path.join(checkpoint_dir, name)
+    artifact_dir = os.path.join(output_dir or checkpoint_dir, name)
+    result = {'input': file_path, 'status': 'ok', 'error': None, 'resumed_from': None, 'artifacts': [], 'checkpoint': None}
+    try:
+        os.makedirs(run_dir, exist_ok=True)
+        keys = _step_keys(file_path, steps)
+        manifest = _read_manifest(run_dir) if resume else None
+        last, entry = _resume_point(manifest, keys)
+
+        completed = manifest['completed'][:last + 1] if last >= 0 else []
+        df = None
+        if entry is not None:
+            df = pd.read_parquet(entry['checkpoint'])
+            result['resumed_from'] = last
+            logging.info(f"Resuming '{file_path}' after step {last} ({steps[last]['stage']}).")
+
+        for i in range(last + 1, len(steps)):
+            step_start = time.perf_counter()
+            df, artifacts = _run_step(df, steps[i], i, file_path, artifact_dir)
+            if steps[i]['stage'] in _FRAME_STAGES:
+                checkpoint = os.path.join(run_dir, f"{i:02d}_{steps[i]['stage']}.parquet")
+                _write_checkpoint(df, checkpoint)
+            else:
+                checkpoint = completed[-1]['checkpoint']
+            completed.append({
+                'step': i,
+                'stage': steps[i]['stage'],
+                'key': keys[i],
+                'checkpoint': checkpoint,
+                'artifacts': artifacts,
+                'seconds': time.perf_counter() - step_start
+            })
+            # Record the step only after its checkpoint is on disk
+            _write_manifest(run_dir, {'input': os.path.abspath(file_path), 'completed': completed})
+
+        result['artifacts'] = [path for step in completed for path in step['artifacts']]
+        result['checkpoint'] = completed[-1]['checkpoint']
+    except Exception as e:
+        logging.error(f"Pipeline Error for '{file_path}': {str(e)}")
+        result.update({'status': 'error', 'error': f"{type(e).__name__}: {str(e)}"})
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+def _init_pipeline_worker():
+    set_headless(True)
+
+def run_pipeline(inputs, steps, checkpoint_dir, output_dir=None, workers=None, resume=True, raise_on_error=False):
+    """
+    Run a recorded load -> clean -> transform -> validate/summary/plot/export pipeline over many files.
+
+    Each input file is processed in its own worker process. After every load, clean and
+    transform step the current frame is checkpointed as Parquet and recorded in a
+    per-input manifest. A rerun resumes each input after its last completed step. Steps
+    whose spec changed, and inputs whose file changed, are recomputed from that point on.
+
+    Parameters:
+        inputs (list): Paths of the input files (.csv, .xlsx/.xls, .parquet or .feather).
+        steps (list of dict): Pipeline spec. Each step has a 'stage' and that stage's keyword arguments:
+            {'stage': 'load', 'sheet_name': ...}                  optional; added automatically
+            {'stage': 'clean', 'strategy': ..., **kwargs}         clean()
+            {'stage': 'transform', **kwargs}                      transform()
+            {'stage': 'validate', 'schema': {...}}                validate(); fails the input on violations
+            {'stage': 'summary', 'filename': ...}                 summary() saved as CSV
+            {'stage': 'plot', 'kind': 'histogram', **kwargs}      chart saved as an image ('output' sets the format)
+            {'stage': 'export', 'format': 'parquet', **kwargs}    export() of the current frame
+        checkpoint_dir (str): Directory for checkpoints and manifests, one subdirectory per input.
+        output_dir (str): Directory for summaries, charts and exports. Defaults to checkpoint_dir.
+        workers (int): Number of worker processes. None uses one per CPU; 1 runs in the current process.
+        resume (bool): Resume from existing checkpoints. If False, every step is rerun.
+        raise_on_error (bool): Raise DataProcessingError after the run if any input failed.
+
+    Returns:
+        list of dict: One result per input, in order, with 'input', 'status' ('ok' or 'error'), 'error',
+                      'resumed_from' (index of the step resumed after, or None), 'checkpoint' (final
+                      frame), 'artifacts' (files written) and 'seconds'.
+    """
+    try:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise DataProcessingError("Pipeline checkpoints require pyarrow. Install it with 'pip install pyarrow'.")
+        steps = _check_steps(steps)
+        # Absolute paths keep the manifests valid when a rerun starts from another directory
+        checkpoint_dir = os.path.abspath(checkpoint_dir)
+        output_dir = os.path.abspath(output_dir) if output_dir else None
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        tasks = [(str(file_path), steps, checkpoint_dir, output_dir, resume) for file_path in inputs]
+
+        if workers == 1 or len(tasks) <= 1:
+            results = [_run_one(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_pipeline_worker) as executor:
+                results = list(executor.map(_run_one, tasks))
+    except DataProcessingError:
+        raise
+    except Exception as e:
+        logging.error(f"Pipeline Error: {str(e)}")
+        raise DataProcessingError(f"Pipeline Error: {str(e)}")
+
+    failed = [result for result in results if result['status'] == 'error']
+    logging.info(f"Pipeline completed: {len(results) - len(failed)} of {len(results)} inputs succeeded.")
+    print(f"✅ Pipeline completed: {len(results) - len(failed)} of {len(results)} inputs succeeded.")
+    if failed and raise_on_error:
+        details = '; '.join(f"{result['input']}: {result['error']}" for result in failed)
+        raise DataProcessingError(f"Pipeline Error: {len(failed)} inputs failed ({details})")
+    return results
@@ -0,0 +1,289 @@
+
+import pandas as pd
+import numpy as np
+import logging
+from dataanalysts.exceptions import DataProcessingError
+
+# Logging Configuration
+logging.basicConfig(
+    level=logging.INFO,
+    filename='streaming.log',
+    filemode='a',
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+class _LogStore:
+    """Counts per logarithmic bucket key, kept in a dense array that starts at key `offset`."""
+
+    def __init__(self, max_bins):
+        self.max_bins = max_bins
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.offset = 0
+
+    def add(self, keys):
+        if keys.size == 0:
+            return
+        lo, hi = int(keys.min()), int(keys.max())
+        if self.counts.size:
+            lo, hi = min(lo, self.offset), max(hi, self.offset + self.counts.size - 1)
+        # Past max_bins keys, the smallest magnitudes are collapsed into the lowest bucket
+        lo = max(lo, hi - self.max_bins + 1)
+        counts = np.zeros(hi - lo + 1, dtype=np.int64)
+        if self.counts.size:
+            old = np.maximum(np.arange(self.offset, self.offset + self.counts.size), lo) - lo
+            counts += np.bincount(old, weights=self.counts, minlength=counts.size).astype(np.int64)
+        counts += np.bincount(np.maximum(keys, lo) - lo, minlength=counts.size)
+        self.counts, self.offset = counts, lo
+
+class _QuantileSketch:
+    """
+    DDSketch-style quantile sketch with a relative error guarantee.
+
+    Values are counted in logarithmic buckets, one store for positive and one for negative
+    magnitudes, so every quantile is within relative_accuracy of a value of the requested
+    rank however skewed the data is. Sketches with the same accuracy merge by adding
+    bucket counts, so chunks can be added in any order.
+    """
+
+    def __init__(self, relative_accuracy=0.005, max_bins=4096):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = np.log(self.gamma)
+        self.positive = _LogStore(max_bins)
+        self.negative = _LogStore(max_bins)
+        self.zeros = 0
+        self.n = 0
+
+    def _keys(self, magnitudes):
+        return np.ceil(np.log(magnitudes) / self.log_gamma).astype(np.int64)
+
+    def update(self, values):
+        positive = values[values > 0]
+        negative = -values[values < 0]
+        self.positive.add(self._keys(positive))
+        self.negative.add(self._keys(negative))
+        self.zeros += values.size - positive.size - negative.size
+        self.n += values.size
+
+    def _side(self, store):
+        upper = np.exp((store.offset + np.arange(store.counts.size)) * self.log_gamma)
+        return 2 * upper / (self.gamma + 1), upper - upper / self.gamma
+
+    def buckets(self):
+        """Representative value, width and count of every non-empty bucket, in ascending order of value."""
+        negative_values, negative_widths = self._side(self.negative)
+        positive_values, positive_widths = self._side(self.positive)
+        values = np.concatenate([-negative_values[::-1], [0.0], positive_values])
+        widths = np.concatenate([negative_widths[::-1], [0.0], positive_widths])
+        counts = np.concatenate([self.negative.counts[::-1], [self.zeros], self.positive.counts])
+        occupied = counts > 0
+        return values[occupied], widths[occupied], counts[occupied]
+
+    def quantile(self, q):
+        values, _, counts = self.buckets()
+        i = int(np.searchsorted(np.cumsum(counts), q * (self.n - 1), side='right'))
+        return float(values[min(i, values.size - 1)])
+
+class _StreamingHistogram:
+    """
+    Fixed-resolution histogram whose range grows as new values arrive.
+
+    When a chunk falls outside the current range, the bin width is doubled and adjacent
+    bins are merged, so any number of chunks can be summarized in one pass with bounded
+    memory. These linear bins only provide histogram counts; quartiles, whiskers and the
+    KDE come from a relative-error quantile sketch, which stays accurate on skewed data
+    where a few large values make the linear bins coarse. Exact count, min, max, mean and
+    variance are tracked alongside.
+    """
+
+    def __init__(self, resolution=4096, relative_accuracy=0.005):
+        self.resolution = resolution
+        self.sketch = _QuantileSketch(relative_accuracy)
+        self.counts = np.zeros(resolution, dtype=np.int64)
+        self.lo = None
+        self.width = None
+        self.n = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def _expand(self, vmin, vmax):
+        half = self.resolution // 2
+        while vmin < self.lo or vmax >= self.lo + self.width * self.resolution:
+            merged = self.counts.reshape(half, 2).sum(axis=1)
+            self.counts = np.zeros(self.resolution, dtype=np.int64)
+            if vmin < self.lo:
+                self.counts[half:] = merged
+                self.lo -= self.width * self.resolution
+            else:
+                self.counts[:half] = merged
+            self.width *= 2
+
+    def update(self, values):
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return
+        vmin, vmax = values.min(), values.max()
+
+        if self.lo is None:
+            span = vmax - vmin
+            self.lo = vmin
+            self.width = (span if span > 0 else max(abs(vmin), 1.0)) / (self.resolution - 1)
+        self._expand(vmin, vmax)
+
+        idx = ((values - self.lo) / self.width).astype(np.int64)
+        np.clip(idx, 0, self.resolution - 1, out=idx)
+        self.counts += np.bincount(idx, minlength=self.resolution)
+        self.sketch.update(values)
+
+        # Chan et al. parallel update of mean and sum of squared deviations
+        n_chunk = values.size
+        chunk_mean = values.mean()
+        delta = chunk_mean - self.mean
+        total = self.n + n_chunk
+        self.m2 += ((values - chunk_mean) ** 2).sum() + delta ** 2 * self.n * n_chunk / total
+        self.mean += delta * n_chunk / total
+        self.n = total
+        self.min = min(self.min, vmin)
+        self.max = max(self.max, vmax)
+
+    @property
+    def std(self):
+        return np.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+    @property
+    def centers(self):
+        return self.lo + self.width * (np.arange(self.resolution) + 0.5)
+
+    def quantile(self, q):
+        """Approximate quantile from the sketch, within its relative accuracy."""
+        return float(np.clip(self.sketch.quantile(q), self.min, self.max))
+
+    def rebin(self, edges):
+        """
+        Redistribute the fine bins onto coarser edges by bin center.
+
+        A fine bin that straddles an edge is counted wholly on one side, so the counts are
+        approximate near the edges.
+        """
+        idx = np.searchsorted(edges, self.centers, side='right') - 1
+        np.clip(idx, 0, len(edges) - 2, out=idx)
+        return np.bincount(idx, weights=self.counts, minlength=len(edges) - 1).astype(np.int64)
+
+    def box(self, label):
+        q1, median, q3 = self.quantile(0.25), self.quantile(0.5), self.quantile(0.75)
+        iqr = q3 - q1
+        lower, upper = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+
+        # Whiskers end at the most extreme sketch bucket still inside the Tukey fences
+        values = self.sketch.buckets()[0]
+        inside = values[(values >= lower) & (values <= upper)]
+        whislo = max(inside[0], self.min) if inside.size else q1
+        whishi = min(inside[-1], self.max) if inside.size else q3
+        return {
+            'label': label,
+            'med': median,
+            'q1': q1,
+            'q3': q3,
+            'whislo': float(min(whislo, q1)),
+            'whishi': float(max(whishi, q3)),
+            'mean': self.mean,
+            'fliers': np.array([])
+        }
+
+    def kde(self, points, cut=2):
+        """
+        Gaussian KDE evaluated from the sketch buckets.
+
+        The bandwidth is Scott's rule with a robust spread, min(std, IQR / 1.349) * n^(-1/5), so
+        a long tail does not oversmooth the bulk of the data. Each bucket's kernel is widened by
+        the bucket's own spread.
+        """
+        iqr = self.quantile(0.75) - self.quantile(0.25)
+        spread = min(self.std, iqr / 1.349) if iqr > 0 else self.std
+        bandwidth = spread * self.n ** (-1 / 5) if self.n > 1 else 0.0
+        values, widths, counts = self.sketch.buckets()
+        if bandwidth <= 0:
+            bandwidth = max(widths.max(), self.width)
+        coords = np.linspace(self.min - cut * bandwidth, self.max + cut * bandwidth, points)
+        scale = np.sqrt(bandwidth ** 2 + widths ** 2 / 12)
+        z = (coords[:, None] - values[None, :]) / scale
+        density = (np.exp(-0.5 * z ** 2) * counts / scale).sum(axis=1)
+        density /= self.n * np.sqrt(2 * np.pi)
+        return coords, density
+
+def distribution_stats(chunks, column, by=None, bins=30, kde_points=200, resolution=4096, relative_accuracy=0.005):
+    """
+    Compute pre-aggregated distribution statistics for a column in a single pass over chunks.
+
+    The result can be passed as stats= to histogram, boxplot and violinplot, so distributions
+    of datasets that never fit in memory can still be plotted.
+
+    Parameters:
+        chunks (iterable or pd.DataFrame): Iterable of DataFrame chunks (e.g. from csv_chunks) or a single DataFrame.
+        column (str): Numeric column to summarize.
+        by (str): Optional categorical column; statistics are computed per group.
+        bins (int): Number of histogram bins.
+        kde_points (int): Number of grid points at which the KDE is evaluated.
+        resolution (int): Number of fine bins kept per group for the histogram. Higher is more accurate.
+        relative_accuracy (float): Relative error bound of the quartiles and whiskers.
+
+    Returns:
+        dict: {'column', 'by', 'count', 'edges', 'groups'} where groups maps each group label
+              (None when by is not given) to a dict with 'count', 'min', 'max', 'mean', 'std',
+              'hist', 'box' and 'kde' entries. Count, min, max, mean and std are exact. 'hist' counts
+              are approximate: fine bins are assigned to the output bins by their centre. Quartiles
+              and whiskers are within relative_accuracy of the exact values, and the KDE is computed
+              from the same quantile sketch.
+    """
+    try:
+        if isinstance(chunks, pd.DataFrame):
+            chunks = [chunks]
+
+        histograms = {}
+        n_chunks = 0
+        for chunk in chunks:
+            n_chunks += 1
+            values = pd.to_numeric(chunk[column], errors='coerce')
+            if by is None:
+                groups = [(None, values)]
+            else:
+                groups = values.groupby(chunk[by], sort=False, observed=True)
+            for label, group_values in groups:
+                if label not in histograms:
+                    histograms[label] = _StreamingHistogram(resolution, relative_accuracy)
+                histograms[label].update(group_values.to_numpy(dtype=np.float64, na_value=np.nan))
+
+        histograms = {label: hist for label, hist in histograms.items() if hist.n > 0}
+        if not histograms:
+            raise ValueError(f"No numeric values found in column '{column}'.")
+
+        # Shared edges so per-group histograms can be summed or compared directly
+        lo = min(hist.min for hist in histograms.values())
+        hi = max(hist.max for hist in histograms.values())
+        edges = np.linspace(lo, hi if hi > lo else lo + 1.0, bins + 1)
+
+        groups = {}
+        for label, hist in histograms.items():
+            groups[label] = {
+                'count': hist.n,
+                'min': float(hist.min),
+                'max': float(hist.max),
+                'mean': float(hist.mean),
+                'std': float(hist.std),
+                'hist': hist.rebin(edges),
+                'box': hist.box(column if label is None else label),
+                'kde': hist.kde(kde_points)
+            }
+
+        logging.info(f"Distribution statistics computed for column '{column}' (by={by}) over {n_chunks} chunks.")
+        return {
+            'column': column,
+            'by': by,
+            'count': sum(group['count'] for group in groups.values()),
+            'edges': edges,
+            'groups': groups
+        }
+    except Exception as e:
+        logging.error(f"Distribution Statistics Error: {str(e)}")
+        raise DataProcessingError(f"Distribution Statistics Error: {str(e)}")
@@ -1,8 +1,9 @@
 
 import pandas as pd
-import numpy as np
+import logging
+from dataanalysts.backends import get_backend, is_numeric_column, is_text_column
 
-def summary(df):
+def summary(df, backend=None):
     """
     Generate a comprehensive summary of a DataFrame, including:
         - Column names
@@ -14,10 +15,19 @@ def summary(df):
 
     Parameters:
         df (pd.DataFrame): Input DataFrame
+        backend (str): Execution backend ('pandas', 'polars', 'arrow' or 'auto'). Defaults to the
+                       backend set with set_backend(); falls back to pandas when the engine is missing.
 
     Returns:
         pd.DataFrame: A DataFrame summarizing the input DataFrame.
     """
+    engine = get_backend(backend)
+    if engine.name != 'pandas':
+        try:
+            return engine.summary(df)
+        except Exception as e:
+            logging.warning(f"{engine.name} backend failed for summary, falling back to pandas: {str(e)}")
+
     summary_data = []
 
     for column in df.columns:
@@ -28,7 +38,7 @@ def summary(df):
             'Unique Values': df[column].nunique()
         }
 
-        if np.issubdtype(df[column].dtype, np.number):
+        if is_numeric_column(df[column]):
             col_data.update({
                 'Min': df[column].min(),
                 'Max': df[column].max(),
@@ -37,7 +47,7 @@ def summary(df):
                 'Top': None,
                 'Frequency': None
             })
-        elif df[column].dtype == 'object':
+        elif is_text_column(df[column]):
             top_value = df[column].mode()[0] if not df[column].mode().empty else None
             col_data.update({
                 'Min': None,
@@ -6,6 +6,7 @@ from sklearn.preprocessing import StandardScaler, MinMaxScaler, RobustScaler, La
 from sklearn.decomposition import PCA
 from sklearn.feature_selection import VarianceThreshold
 from dataanalysts.exceptions import DataTransformationError
+from dataanalysts.cache import memoize_frame
 
 # Logging Configuration
 logging.basicConfig(
@@ -15,6 +16,7 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+@memoize_frame
 def transform(
     df,
     strategy='standard',
@@ -0,0 +1,283 @@
+
+import re
+import logging
+import numpy as np
+import pandas as pd
+from pandas.api import types
+from dataanalysts.exceptions import DataValidationError
+
+# No logging.basicConfig here: cleaner imports this module before its own logging
+# configuration runs, and only the first basicConfig call takes effect.
+
+_RULES = {'dtype', 'required', 'nullable', 'min', 'max', 'allowed', 'regex', 'unique'}
+
+_DTYPE_CHECKS = {
+    'number': lambda dtype: types.is_numeric_dtype(dtype) and not types.is_bool_dtype(dtype),
+    'integer': types.is_integer_dtype,
+    'float': types.is_float_dtype,
+    'string': lambda dtype: types.is_string_dtype(dtype) and not isinstance(dtype, pd.CategoricalDtype),
+    'bool': types.is_bool_dtype,
+    'datetime': types.is_datetime64_any_dtype,
+    'category': lambda dtype: isinstance(dtype, pd.CategoricalDtype)
+}
+
+def _compile(schema):
+    """Check the schema for unknown rules and precompile regular expressions."""
+    if not isinstance(schema, dict) or not schema:
+        raise DataValidationError("Schema must be a non-empty dict mapping column names to rule dicts.")
+    compiled = {}
+    for column, rules in schema.items():
+        unknown = set(rules) - _RULES
+        if unknown:
+            raise DataValidationError(
+                f"Unknown rules {sorted(unknown)} for column '{column}'. Supported rules: {sorted(_RULES)}."
+            )
+        rules = dict(rules)
+        if 'dtype' in rules and rules['dtype'] not in _DTYPE_CHECKS:
+            try:
+                rules['dtype'] = pd.api.types.pandas_dtype(rules['dtype'])
+            except TypeError:
+                raise DataValidationError(
+                    f"Unknown dtype '{rules['dtype']}' for column '{column}'. Use one of "
+                    f"{sorted(_DTYPE_CHECKS)} or a pandas/numpy dtype."
+                )
+        if 'regex' in rules:
+            rules['regex'] = re.compile(rules['regex'])
+        if 'allowed' in rules:
+            rules['allowed'] = list(rules['allowed'])
+        compiled[column] = rules
+    return compiled
+
+def _dtype_matches(dtype, expected):
+    if isinstance(expected, str):
+        return _DTYPE_CHECKS[expected](dtype)
+    return dtype == expected
+
+def _rangeable(dtype):
+    """Whether min/max rules can compare the column's values."""
+    return (types.is_numeric_dtype(dtype) or types.is_datetime64_any_dtype(dtype)
+            or types.is_timedelta64_dtype(dtype))
+
+def _describe(expected):
+    return expected if isinstance(expected, str) else str(expected)
+
+class _HashRuns:
+    """
+    Set of uint64 hashes stored as sorted runs of decreasing size.
+
+    A new run is merged with the runs no larger than itself, like carries in a binary
+    counter, so there are O(log n) runs and adding n hashes costs O(n log n) in total
+    rather than re-sorting everything seen so far on every chunk.
+    """
+
+    def __init__(self):
+        self.runs = []
+
+    def contains(self, hashes):
+        # Searching in sorted order keeps the lookups in each run cache-friendly
+        order = np.argsort(hashes)
+        queries = hashes[order]
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self.runs:
+            positions = np.minimum(np.searchsorted(run, queries), len(run) - 1)
+            found[order] |= run[positions] == queries
+        return found
+
+    def add(self, hashes):
+        # An all-null chunk has nothing to add, and an empty run would break contains()
+        if hashes.size == 0:
+            return
+        run = np.sort(hashes)
+        while self.runs and len(self.runs[-1]) <= len(run):
+            # A stable sort of two concatenated sorted runs is a linear-time merge
+            run = np.concatenate([self.runs.pop(), run])
+            run.sort(kind='stable')
+        self.runs.append(run)
+
+class _Validator:
+    """
+    Accumulates violations of a compiled schema over one or more chunks.
+
+    Every rule is evaluated as a boolean mask over the column; only the number of violating
+    rows and the first few row labels are kept, so memory does not grow with the data.
+    """
+
+    def __init__(self, schema, sample_size=5):
+        self.schema = _compile(schema)
+        self.sample_size = sample_size
+        self.rows = 0
+        self.chunks = 0
+        self.violations = {}
+        # Hashes of values already seen by each unique column, so duplicates across chunks are found
+        self._seen = {column: _HashRuns() for column, rules in self.schema.items() if rules.get('unique')}
+
+    def _record(self, column, rule, index, count=None, detail=None):
+        entry = self.violations.setdefault(column, {}).setdefault(rule, {'count': 0, 'sample': []})
+        entry['count'] += len(index) if count is None else count
+        room = self.sample_size - len(entry['sample'])
+        if room > 0:
+            entry['sample'].extend(index[:room].tolist())
+        if detail is not None:
+            entry['detail'] = detail
+
+    def _unique_mask(self, column, values, present):
+        duplicated = values.duplicated() & present
+        present_values = values[present]
+        # Hash numeric values as float64, so that e.g. 1 in an int64 chunk and 1.0 in a chunk
+        # that became float64 because of missing values count as the same value
+        if types.is_numeric_dtype(values.dtype) and not types.is_bool_dtype(values.dtype):
+            present_values = present_values.astype(np.float64)
+        hashes = pd.util.hash_pandas_object(present_values, index=False).to_numpy()
+        seen = self._seen[column]
+        before = np.zeros(len(values), dtype=bool)
+        before[np.flatnonzero(present.to_numpy())] = seen.contains(hashes)
+        seen.add(hashes)
+        return duplicated.to_numpy() | before
+
+    def _rule_masks(self, column, values, rules, typed, ranged):
+        """
+        Yield (rule, mask) for every value rule of a column; masks are numpy bool arrays.
+
+        Range and pattern rules are skipped when the column does not have its declared dtype,
+        and range rules also when the column is not numeric or datetime (ranged is False).
+        """
+        present = values.notna()
+        if rules.get('nullable', True) is False:
+            yield 'nullable', ~present.to_numpy()
+        if 'min' in rules and typed and ranged:
+            yield 'min', (present & (values < rules['min'])).to_numpy()
+        if 'max' in rules and typed and ranged:
+            yield 'max', (present & (values > rules['max'])).to_numpy()
+        if 'allowed' in rules:
+            yield 'allowed', (present & ~values.isin(rules['allowed'])).to_numpy()
+        if 'regex' in rules and typed:
+            matched = values.astype(str).str.fullmatch(rules['regex']) if not types.is_string_dtype(values.dtype) \
+                else values.str.fullmatch(rules['regex'])
+            yield 'regex', (present & ~matched.fillna(False).astype(bool)).to_numpy()
+        if rules.get('unique'):
+            yield 'unique', self._unique_mask(column, values, present)
+
+    def check(self, df, collect_mask=False):
+        """
+        Check one chunk against the schema.
+
+        Returns:
+            np.ndarray: Boolean mask of rows violating any rule when collect_mask is True, otherwise None.
+        """
+        self.rows += len(df)
+        self.chunks += 1
+        invalid = np.zeros(len(df), dtype=bool) if collect_mask else None
+
+        for column, rules in self.schema.items():
+            if column not in df.columns:
+                if rules.get('required', True):
+                    self._record(column, 'required', df.index[:0], count=len(df), detail='column is missing')
+                    if collect_mask:
+                        invalid[:] = True
+                continue
+
+            values = df[column]
+            typed = True
+            if 'dtype' in rules and not _dtype_matches(values.dtype, rules['dtype']):
+                typed = False
+                self._record(column, 'dtype', df.index, detail=f"expected {_describe(rules['dtype'])}, got {values.dtype}")
+                if collect_mask:
+                    invalid[:] = True
+
+            ranged = _rangeable(values.dtype)
+            if typed and not ranged and ('min' in rules or 'max' in rules):
+                self._record(column, 'dtype', df.index, detail=f"min/max need a numeric or datetime column, got {values.dtype}")
+                if collect_mask:
+                    invalid[:] = True
+
+            for rule, mask in self._rule_masks(column, values, rules, typed, ranged):
+                if mask.any():
+                    self._record(column, rule, df.index[mask])
+                    if collect_mask:
+                        invalid |= mask
+        return invalid
+
+    def report(self):
+        return {
+            'valid': not self.violations,
+            'rows': self.rows,
+            'chunks': self.chunks,
+            'invalid_values': sum(entry['count'] for rules in self.violations.values() for entry in rules.values()),
+            'violations': self.violations
+        }
+
+def _summarize(report, limit=5):
+    lines = []
+    for column, rules in report['violations'].items():
+        for rule, entry in rules.items():
+            detail = f" ({entry['detail']})" if 'detail' in entry else ''
+            lines.append(f"{column}.{rule}: {entry['count']} rows{detail}, e.g. rows {entry['sample']}")
+    more = f"; ... {len(lines) - limit} more" if len(lines) > limit else ''
+    return '; '.join(lines[:limit]) + more
+
+def validate(data, schema, sample_size=5, raise_on_error=False):
+    """
+    Validate a DataFrame, or a stream of chunks, against a declarative schema.
+
+    Every rule is checked as a vectorized boolean mask over its column, in one pass over
+    the data and without copying it. Chunks are checked one at a time, and uniqueness is
+    tracked across chunks.
+
+    Parameters:
+        data (pd.DataFrame or iterable): A DataFrame, or an iterable of chunks (e.g. from csv_chunks).
+        schema (dict): Maps each column to a dict of rules:
+            dtype (str): 'number', 'integer', 'float', 'string', 'bool', 'datetime', 'category'
+                         or an exact pandas/numpy dtype such as 'int64'.
+            required (bool): Column must be present (default: True).
+            nullable (bool): Missing values are allowed (default: True).
+            min, max: Inclusive bounds for the values of numeric or datetime columns.
+            allowed (list): Set of allowed values.
+            regex (str): Pattern every value must fully match.
+            unique (bool): Values must not repeat.
+        sample_size (int): Number of violating row labels kept per rule.
+        raise_on_error (bool): Raise DataValidationError when any rule is violated.
+
+    Returns:
+        dict: {'valid', 'rows', 'chunks', 'invalid_values', 'violations'} where violations maps
+              column -> rule -> {'count': violating rows, 'sample': first row labels}.
+    """
+    try:
+        validator = _Validator(schema, sample_size=sample_size)
+        chunks = [data] if isinstance(data, pd.DataFrame) else data
+        for chunk in chunks:
+            validator.check(chunk)
+        report = validator.report()
+    except DataValidationError:
+        raise
+    except Exception as e:
+        logging.error(f"Data Validation Error: {str(e)}")
+        raise DataValidationError(f"Data Validation Error: {str(e)}")
+
+    if report['valid']:
+        logging.info(f"Validated {report['rows']} rows in {report['chunks']} chunks: no violations.")
+    else:
+        logging.warning(f"Validated {report['rows']} rows in {report['chunks']} chunks: {_summarize(report)}")
+        if raise_on_error:
+            raise DataValidationError(f"Data Validation Error: {_summarize(report)}")
+    return report
+
+def invalid_rows(df, schema):
+    """
+    Flag the rows of a DataFrame that violate any rule of the schema.
+
+    Parameters:
+        df (pd.DataFrame): Input DataFrame.
+        schema (dict): Schema as described in validate().
+
+    Returns:
+        tuple: (pd.Series of bool aligned with df.index, validation report dict).
+    """
+    try:
+        validator = _Validator(schema)
+        mask = validator.check(df, collect_mask=True)
+        return pd.Series(mask, index=df.index), validator.report()
+    except DataValidationError:
+        raise
+    except Exception as e:
+        logging.error(f"Data Validation Error: {str(e)}")
+        raise DataValidationError(f"Data Validation Error: {str(e)}")
@@ -1,8 +1,21 @@
 
+import os
+import io
+import functools
+import inspect
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import LogNorm
+from matplotlib.patches import Patch
 import seaborn as sns
 import pandas as pd
+import numpy as np
 import logging
+from dataanalysts import load
+from dataanalysts.cache import fingerprint, make_key, LRUCache, DiskCache, TieredCache
 from dataanalysts.exceptions import DataVisualizationError
 
 # Logging Configuration
@@ -13,36 +26,213 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# Headless mode: charts are rendered off-screen and returned as image bytes instead of shown
+_HEADLESS = False
+
+# pyplot backend in use before headless mode was enabled, restored when it is disabled
+_SAVED_BACKEND = None
+
+def set_headless(enabled=True):
+    """
+    Switch all plotting functions to headless rendering.
+
+    In headless mode pyplot is moved to the non-interactive Agg backend, charts are drawn on
+    standalone Figure objects that are never registered with pyplot, and every plotting
+    function returns PNG bytes (or the format given by output=) instead of calling plt.show().
+
+    Parameters:
+        enabled (bool): True to enable headless rendering, False to restore the previous pyplot
+                        backend and plt.show().
+    """
+    global _HEADLESS, _SAVED_BACKEND
+    if enabled and not _HEADLESS:
+        _SAVED_BACKEND = plt.get_backend()
+        plt.switch_backend('Agg')
+    elif not enabled and _HEADLESS and _SAVED_BACKEND is not None:
+        plt.switch_backend(_SAVED_BACKEND)
+        _SAVED_BACKEND = None
+    _HEADLESS = enabled
+    logging.info(f"Headless rendering {'enabled' if enabled else 'disabled'}.")
+
+def _new_figure(size, output=None, save_path=None):
+    """Create a figure and axes, detached from pyplot when the chart is rendered to bytes."""
+    if _HEADLESS or output or save_path:
+        fig = Figure(figsize=size)
+        FigureCanvasAgg(fig)
+    else:
+        fig = plt.figure(figsize=size)
+    return fig, fig.subplots()
+
+def _finish(fig, output=None, save_path=None):
+    """
+    Show the figure interactively, or render it to image bytes and release it.
+
+    Returns:
+        bytes or None: Rendered image, or None when the figure was shown.
+    """
+    if not (_HEADLESS or output or save_path):
+        plt.show()
+        return None
+
+    fmt = output or (os.path.splitext(save_path)[1].lstrip('.') if save_path else '') or 'png'
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, format=fmt, bbox_inches='tight')
+    finally:
+        # Figures created by seaborn grids are registered with pyplot and must be closed there
+        plt.close(fig)
+        fig.clear()
+    image = buffer.getvalue()
+    if save_path:
+        with open(save_path, 'wb') as f:
+            f.write(image)
+    return image
+
+# Render cache for charts rendered to bytes; None until enable_render_cache() is called
+_RENDER_CACHE = None
+
+def enable_render_cache(max_entries=128, max_bytes=256 * 1024 ** 2, disk_dir=None, disk_max_bytes=None):
+    """
+    Cache rendered chart images keyed by a fingerprint of the referenced columns and the call parameters.
+
+    Only calls that render to bytes (output=, save_path= or headless mode) are cached; a repeated
+    call on unchanged data returns the stored image without re-rendering.
+
+    Parameters:
+        max_entries (int): Maximum number of images kept in memory.
+        max_bytes (int): Maximum total size of the in-memory images.
+        disk_dir (str): Directory for an on-disk tier that survives restarts. None keeps the cache in memory only.
+        disk_max_bytes (int): Maximum total size of the on-disk tier, or None for no limit.
+    """
+    global _RENDER_CACHE
+    disk = DiskCache(disk_dir, max_bytes=disk_max_bytes, suffix='.img') if disk_dir else None
+    _RENDER_CACHE = TieredCache(LRUCache(max_entries=max_entries, max_bytes=max_bytes), disk)
+    logging.info(f"Render cache enabled (max_entries={max_entries}, max_bytes={max_bytes}, disk_dir={disk_dir}).")
+
+def disable_render_cache():
+    """Turn the render cache off and drop its in-memory entries. On-disk entries are kept."""
+    global _RENDER_CACHE
+    if _RENDER_CACHE is not None:
+        _RENDER_CACHE.memory.clear()
+    _RENDER_CACHE = None
+    logging.info("Render cache disabled.")
+
+def render_cache_stats():
+    """
+    Return hit/miss counters of the render cache.
+
+    Returns:
+        dict: Counters from TieredCache.stats(), or an empty dict when the cache is disabled.
+    """
+    return _RENDER_CACHE.stats() if _RENDER_CACHE is not None else {}
+
+def _cached_render(column_params=None):
+    """
+    Serve repeated renders of a plotting function from the render cache.
+
+    Parameters:
+        column_params (list): Names of the parameters holding column names referenced by the chart.
+                              If None, every column of the DataFrame is fingerprinted.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            output, save_path = params.pop('output'), params.pop('save_path')
+            if _RENDER_CACHE is None or not (_HEADLESS or output or save_path):
+                return func(*args, **kwargs)
+
+            df = params.pop('df')
+            if df is None:
+                data_key = None
+            elif column_params is None:
+                data_key = fingerprint(df)
+            else:
+                columns = [params[name] for name in column_params if params.get(name) in df.columns]
+                data_key = fingerprint(df, list(dict.fromkeys(columns)))
+            fmt = output or (os.path.splitext(save_path)[1].lstrip('.') if save_path else '') or 'png'
+            key = make_key(func.__name__, data_key, fmt, params)
+
+            image = _RENDER_CACHE.get(key)
+            if image is None:
+                image = func(*args, **kwargs)
+                _RENDER_CACHE.put(key, image)
+            else:
+                if save_path:
+                    with open(save_path, 'wb') as f:
+                        f.write(image)
+                logging.info(f"{func.__name__} served from render cache.")
+            return image
+        return wrapper
+    return decorator
+
 # Histogram
-def histogram(df, column, bins=30, kde=True, size=(10, 6), title_fontsize=16, axis_fontsize=14, custom_title=None):
+@_cached_render(['column'])
+def histogram(df, column, bins=30, kde=True, size=(10, 6), title_fontsize=16, axis_fontsize=14, custom_title=None, stats=None, output=None, save_path=None):
     """
     Plot a histogram for a specified column with advanced customization.
 
     Parameters:
-        df (pd.DataFrame): Input DataFrame.
+        df (pd.DataFrame): Input DataFrame. May be None when stats is given.
         column (str): Column name for plotting.
-        bins (int): Number of bins for the histogram.
+        bins (int): Number of bins for the histogram. Ignored when stats is given.
         kde (bool): Whether to show Kernel Density Estimate.
         size (tuple): Figure size in the format (width, height).
         title_fontsize (int): Font size for the title.
         axis_fontsize (int): Font size for axis labels.
         custom_title (str): Custom title for the chart. If None, a default title is used.
+        stats (dict): Pre-aggregated statistics from distribution_stats. If given, bins and KDE are
+                      drawn from the statistics instead of the raw column.
+        output (str): Image format ('png', 'svg', ...) to render to. If given, the chart is returned as bytes
+                      instead of being shown.
+        save_path (str): File to write the rendered image to. The format is taken from the extension
+                         unless output is given.
+
+    Returns:
+        bytes or None: Rendered image when output, save_path or headless mode is used, otherwise None.
     """
     try:
-        plt.figure(figsize=size)
-        sns.histplot(df[column], bins=bins, kde=kde, color='skyblue')
-        plt.title(custom_title if custom_title else f'Histogram of {column}', fontsize=title_fontsize, fontweight='bold')
-        plt.xlabel(column, fontsize=axis_fontsize)
-        plt.ylabel('Frequency', fontsize=axis_fontsize)
-        plt.grid(True, linestyle='--', alpha=0.5)
-        plt.show()
+        fig, ax = _new_figure(size, output, save_path)
+        if stats is not None:
+            _histogram_from_stats(ax, stats, column, kde)
+        else:
+            sns.histplot(df[column], bins=bins, kde=kde, color='skyblue', ax=ax)
+        ax.set_title(custom_title if custom_title else f'Histogram of {column}', fontsize=title_fontsize, fontweight='bold')
+        ax.set_xlabel(column, fontsize=axis_fontsize)
+        ax.set_ylabel('Frequency', fontsize=axis_fontsize)
+        ax.grid(True, linestyle='--', alpha=0.5)
+        image = _finish(fig, output, save_path)
         logging.info(f"Histogram plotted for column: {column}")
+        return image
     except Exception as e:
         logging.error(f"Histogram Error: {str(e)}")
         raise DataVisualizationError(f"Histogram Error: {str(e)}")
 
+def _histogram_from_stats(ax, stats, column, kde):
+    """Draw bars (and optionally the KDE scaled to counts) from distribution_stats output."""
+    groups = _group_stats(stats, column)
+    edges = stats['edges']
+    counts = sum(group['hist'] for group in groups)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color='skyblue', edgecolor='white')
+    if kde:
+        bin_width = edges[1] - edges[0]
+        for group in groups:
+            coords, density = group['kde']
+            ax.plot(coords, density * group['count'] * bin_width, color='skyblue', linewidth=2)
+
+def _group_stats(stats, column):
+    """Return the per-group statistics in order, checking they describe the plotted column."""
+    if stats['column'] != column:
+        raise ValueError(f"Statistics were computed for column '{stats['column']}', not '{column}'.")
+    return list(stats['groups'].values())
+
 # Bar Chart
-def barchart(df, x_col, y_col, size=(12, 7), title_fontsize=16, axis_fontsize=14, custom_title=None):
+@_cached_render(['x_col', 'y_col'])
+def barchart(df, x_col, y_col, size=(12, 7), title_fontsize=16, axis_fontsize=14, custom_title=None, output=None, save_path=None):
     """
     Plot a bar chart for two specified columns with advanced customization.
 
@@ -54,23 +244,32 @@ def barchart(df, x_col, y_col, size=(12, 7), title_fontsize=16, axis_fontsize=14
         title_fontsize (int): Font size for the title.
         axis_fontsize (int): Font size for axis labels.
         custom_title (str): Custom title for the chart. If None, a default title is used.
+        output (str): Image format ('png', 'svg', ...) to render to. If given, the chart is returned as bytes
+                      instead of being shown.
+        save_path (str): File to write the rendered image to. The format is taken from the extension
+                         unless output is given.
+
+    Returns:
+        bytes or None: Rendered image when output, save_path or headless mode is used, otherwise None.
     """
     try:
-        plt.figure(figsize=size)
-        sns.barplot(x=x_col, y=y_col, data=df, palette='viridis')
-        plt.title(custom_title if custom_title else f'Bar Chart: {x_col} vs {y_col}', fontsize=title_fontsize, fontweight='bold')
-        plt.xlabel(x_col, fontsize=axis_fontsize)
-        plt.ylabel(y_col, fontsize=axis_fontsize)
-        plt.xticks(rotation=45)
-        plt.grid(axis='y', linestyle='--', alpha=0.5)
-        plt.show()
+        fig, ax = _new_figure(size, output, save_path)
+        sns.barplot(x=x_col, y=y_col, data=df, palette='viridis', ax=ax)
+        ax.set_title(custom_title if custom_title else f'Bar Chart: {x_col} vs {y_col}', fontsize=title_fontsize, fontweight='bold')
+        ax.set_xlabel(x_col, fontsize=axis_fontsize)
+        ax.set_ylabel(y_col, fontsize=axis_fontsize)
+        ax.tick_params(axis='x', labelrotation=45)
+        ax.grid(axis='y', linestyle='--', alpha=0.5)
+        image = _finish(fig, output, save_path)
         logging.info(f"Bar Chart plotted for columns: {x_col} vs {y_col}")
+        return image
     except Exception as e:
         logging.error(f"Bar Chart Error: {str(e)}")
         raise DataVisualizationError(f"Bar Chart Error: {str(e)}")
 
 # Line Plot
-def linechart(df, x_col, y_col, size=(12, 7), title_fontsize=16, axis_fontsize=14, custom_title=None):
+@_cached_render(['x_col', 'y_col'])
+def linechart(df, x_col, y_col, size=(12, 7), title_fontsize=16, axis_fontsize=14, custom_title=None, output=None, save_path=None):
     """
     Plot a line chart for two specified columns with advanced customization.
 
@@ -82,25 +281,112 @@ def linechart(df, x_col, y_col, size=(12, 7), title_fontsize=16, axis_fontsize=1
         title_fontsize (int): Font size for the title.
         axis_fontsize (int): Font size for axis labels.
         custom_title (str): Custom title for the chart. If None, a default title is used.
+        output (str): Image format ('png', 'svg', ...) to render to. If given, the chart is returned as bytes
+                      instead of being shown.
+        save_path (str): File to write the rendered image to. The format is taken from the extension
+                         unless output is given.
+
+    Returns:
+        bytes or None: Rendered image when output, save_path or headless mode is used, otherwise None.
     """
     try:
-        plt.figure(figsize=size)
-        sns.lineplot(x=x_col, y=y_col, data=df, marker='o', color='blue')
-        plt.title(custom_title if custom_title else f'Line Chart: {x_col} vs {y_col}', fontsize=title_fontsize, fontweight='bold')
-        plt.xlabel(x_col, fontsize=axis_fontsize)
-        plt.ylabel(y_col, fontsize=axis_fontsize)
-        plt.grid(True, linestyle='--', alpha=0.5)
-        plt.show()
+        fig, ax = _new_figure(size, output, save_path)
+        sns.lineplot(x=x_col, y=y_col, data=df, marker='o', color='blue', ax=ax)
+        ax.set_title(custom_title if custom_title else f'Line Chart: {x_col} vs {y_col}', fontsize=title_fontsize, fontweight='bold')
+        ax.set_xlabel(x_col, fontsize=axis_fontsize)
+        ax.set_ylabel(y_col, fontsize=axis_fontsize)
+        ax.grid(True, linestyle='--', alpha=0.5)
+        image = _finish(fig, output, save_path)
         logging.info(f"Line Chart plotted for columns: {x_col} vs {y_col}")
+        return image
     except Exception as e:
         logging.error(f"Line Chart Error: {str(e)}")
         raise DataVisualizationError(f"Line Chart Error: {str(e)}")
 
+# Row count above which scatter switches to density rendering
+DENSITY_THRESHOLD = 1_000_000
+
+def _bin_2d(x, y, gridsize, extent, codes=None, n_categories=1):
+    """
+    Bin x/y coordinates into 2-D count grids using vectorized NumPy indexing.
+
+    Parameters:
+        x (np.ndarray): X coordinates.
+        y (np.ndarray): Y coordinates.
+        gridsize (int): Number of bins along each axis.
+        extent (tuple): (xmin, xmax, ymin, ymax) covered by the grid.
+        codes (np.ndarray or None): Integer category code per point, for one grid per category.
+        n_categories (int): Number of distinct category codes.
+
+    Returns:
+        np.ndarray: Counts of shape (n_categories, gridsize, gridsize), indexed [category, y_bin, x_bin].
+    """
+    xmin, xmax, ymin, ymax = extent
+    x_span = (xmax - xmin) or 1.0
+    y_span = (ymax - ymin) or 1.0
+    xi = ((x - xmin) * (gridsize / x_span)).astype(np.int64)
+    yi = ((y - ymin) * (gridsize / y_span)).astype(np.int64)
+    np.clip(xi, 0, gridsize - 1, out=xi)
+    np.clip(yi, 0, gridsize - 1, out=yi)
+    cells = yi * gridsize + xi
+    if codes is not None:
+        cells += codes.astype(np.int64) * (gridsize * gridsize)
+    counts = np.bincount(cells, minlength=n_categories * gridsize * gridsize)
+    return counts.reshape(n_categories, gridsize, gridsize)
+
+def _scatter_density(ax, df, x_col, y_col, hue, gridsize):
+    """
+    Render a scatter as an aggregated density image instead of individual points.
+
+    Without hue, cell color encodes the log point count. With hue, each cell takes the
+    color of its dominant category and its opacity encodes the log point count.
+    """
+    x = pd.to_numeric(df[x_col], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    y = pd.to_numeric(df[y_col], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = np.isfinite(x) & np.isfinite(y)
+    if hue:
+        codes, categories = pd.factorize(df[hue])
+        valid &= codes >= 0
+        codes = codes[valid]
+    x, y = x[valid], y[valid]
+    if x.size == 0:
+        raise ValueError(f"No finite values to plot for columns {x_col} and {y_col}.")
+
+    extent = (x.min(), x.max(), y.min(), y.max())
+
+    if not hue:
+        grid = _bin_2d(x, y, gridsize, extent)[0]
+        image = ax.imshow(
+            np.ma.masked_equal(grid, 0), origin='lower', extent=extent, aspect='auto',
+            cmap='viridis', norm=LogNorm(vmin=1, vmax=max(grid.max(), 1)), interpolation='nearest'
+        )
+        ax.figure.colorbar(image, ax=ax, label='Count')
+        return
+
+    # One grid per category, so the dominant category per cell is a single argmax
+    grids = _bin_2d(x, y, gridsize, extent, codes=codes, n_categories=len(categories))
+    total = grids.sum(axis=0)
+    dominant = grids.argmax(axis=0)
+    palette = np.asarray(sns.color_palette('viridis', len(categories)))
+    rgba = np.zeros((gridsize, gridsize, 4))
+    rgba[..., :3] = palette[dominant]
+    rgba[..., 3] = np.log1p(total) / np.log1p(max(total.max(), 1))
+    ax.imshow(rgba, origin='lower', extent=extent, aspect='auto', interpolation='nearest')
+    ax.legend(
+        handles=[Patch(color=palette[i], label=str(category)) for i, category in enumerate(categories)],
+        title=hue
+    )
+
 # Scatter Plot
-def scatter(df, x_col, y_col, hue=None, size=(10, 6), title_fontsize=16, axis_fontsize=14, custom_title=None):
+@_cached_render(['x_col', 'y_col', 'hue'])
+def scatter(df, x_col, y_col, hue=None, size=(10, 6), title_fontsize=16, axis_fontsize=14, custom_title=None,
+            density=None, gridsize=300, density_threshold=DENSITY_THRESHOLD, output=None, save_path=None):
     """
     Plot a scatter plot for two specified columns with advanced customization.
 
+    Large inputs are rendered as a 2-D density image so render time stays roughly constant
+    in the number of rows.
+
     Parameters:
         df (pd.DataFrame): Input DataFrame.
         x_col (str): Column for x-axis.
@@ -110,114 +396,295 @@ def scatter(df, x_col, y_col, hue=None, size=(10, 6), title_fontsize=16, axis_fo
         title_fontsize (int): Font size for the title.
         axis_fontsize (int): Font size for axis labels.
         custom_title (str): Custom title for the chart. If None, a default title is used.
+        density (bool or None): Force density rendering on (True) or off (False). If None, density
+                                rendering is used when the row count exceeds density_threshold.
+        gridsize (int): Number of bins along each axis in density mode.
+        density_threshold (int): Row count above which density mode is switched on automatically.
+        output (str): Image format ('png', 'svg', ...) to render to. If given, the chart is returned as bytes
+                      instead of being shown.
+        save_path (str): File to write the rendered image to. The format is taken from the extension
+                         unless output is given.
+
+    Returns:
+        bytes or None: Rendered image when output, save_path or headless mode is used, otherwise None.
     """
     try:
-        plt.figure(figsize=size)
-        sns.scatterplot(x=x_col, y=y_col, data=df, hue=hue, palette='viridis')
-        plt.title(custom_title if custom_title else f'Scatter Plot: {x_col} vs {y_col}', fontsize=title_fontsize, fontweight='bold')
-        plt.xlabel(x_col, fontsize=axis_fontsize)
-        plt.ylabel(y_col, fontsize=axis_fontsize)
-        plt.grid(True, linestyle='--', alpha=0.5)
-        plt.show()
-        logging.info(f"Scatter Plot plotted for columns: {x_col} vs {y_col}")
+        if density is None:
+            density = len(df) > density_threshold
+        fig, ax = _new_figure(size, output, save_path)
+        if density:
+            _scatter_density(ax, df, x_col, y_col, hue, gridsize)
+        else:
+            sns.scatterplot(x=x_col, y=y_col, data=df, hue=hue, palette='viridis', ax=ax)
+        ax.set_title(custom_title if custom_title else f'Scatter Plot: {x_col} vs {y_col}', fontsize=title_fontsize, fontweight='bold')
+        ax.set_xlabel(x_col, fontsize=axis_fontsize)
+        ax.set_ylabel(y_col, fontsize=axis_fontsize)
+        ax.grid(True, linestyle='--', alpha=0.5)
+        image = _finish(fig, output, save_path)
+        logging.info(f"Scatter Plot plotted for columns: {x_col} vs {y_col} (density={density})")
+        return image
     except Exception as e:
         logging.error(f"Scatter Plot Error: {str(e)}")
         raise DataVisualizationError(f"Scatter Plot Error: {str(e)}")
 
+# Correlation matrices keyed by data fingerprint, shared by heatmap and pairplot
+_CORRELATION_CACHE = OrderedDict()
+_CORRELATION_CACHE_SIZE = 16
+
+def _correlation(df, columns):
+    """
+    Pairwise-complete Pearson correlation of numeric columns, computed once and cached.
+
+    All pairs are computed together with four float32 matrix products over the centered
+    data and its missing-value mask, instead of pandas' per-pair loop.
+
+    Returns:
+        pd.DataFrame: Correlation matrix indexed by columns.
+    """
+    key = fingerprint(df, columns)
+    if key in _CORRELATION_CACHE:
+        _CORRELATION_CACHE.move_to_end(key)
+        return _CORRELATION_CACHE[key]
+
+    values = df[list(columns)].to_numpy(dtype=np.float64, na_value=np.nan)
+    mask = np.isfinite(values)
+    # Center in float64 first so the float32 products don't lose precision to large means
+    values = np.where(mask, values - np.nanmean(np.where(mask, values, np.nan), axis=0), 0).astype(np.float32)
+    weights = mask.astype(np.float32)
+
+    n = weights.T @ weights
+    sums = values.T @ weights
+    squares = (values * values).T @ weights
+    cross = values.T @ values
+    with np.errstate(divide='ignore', invalid='ignore'):
+        covariance = cross - sums * sums.T / n
+        variance = squares - sums * sums / n
+        corr = covariance / np.sqrt(variance * variance.T)
+    corr = pd.DataFrame(np.clip(corr, -1, 1), index=columns, columns=columns)
+
+    _CORRELATION_CACHE[key] = corr
+    if len(_CORRELATION_CACHE) > _CORRELATION_CACHE_SIZE:
+        _CORRELATION_CACHE.popitem(last=False)
+    return corr
+
+def _top_correlated(corr, k):
+    """Pick the k columns with the strongest absolute correlation to any other column, in original order."""
+    if k is None or len(corr) <= k:
+        return list(corr.columns)
+    strength = corr.abs().to_numpy(copy=True)
+    np.fill_diagonal(strength, np.nan)
+    score = pd.Series(np.nanmax(np.nan_to_num(strength, nan=-1.0), axis=1), index=corr.columns)
+    selected = set(score.nlargest(k).index)
+    return [col for col in corr.columns if col in selected]
+
+def _stratified_sample(df, hue, max_rows, random_state=0):
+    """Subsample to about max_rows rows, keeping each hue category's share and at least one row of it."""
+    if max_rows is None or len(df) <= max_rows:
+        return df
+    if hue is None:
+        return df.sample(n=max_rows, random_state=random_state)
+    rng = np.random.default_rng(random_state)
+    shuffled = df.iloc[rng.permutation(len(df))]
+    group_sizes = shuffled[hue].map(shuffled[hue].value_counts())
+    quota = np.maximum(1, np.round(group_sizes * (max_rows / len(df))))
+    keep = shuffled.groupby(hue, sort=False, observed=True).cumcount() < quota
+    return shuffled[keep.to_numpy()].sort_index()
+
 # Heatmap
-def heatmap(df, annot=True, cmap='coolwarm', size=(12, 8), title_fontsize=16, custom_title=None):
+@_cached_render()
+def heatmap(df, annot=True, cmap='coolwarm', size=(12, 8), title_fontsize=16, custom_title=None, output=None, save_path=None,
+            max_columns=None, annot_limit=20):
     """
     Plot a heatmap showing the correlation between numeric columns with advanced customization.
 
     Parameters:
-        df (pd.DataFrame): Input DataFrame.
+        df (pd.DataFrame): Input DataFrame. Non-numeric columns are ignored.
         annot (bool): Whether to annotate the heatmap with correlation values.
         cmap (str): Colormap for the heatmap.
         size (tuple): Figure size in the format (width, height).
         title_fontsize (int): Font size for the title.
         custom_title (str): Custom title for the chart. If None, a default title is used.
+        output (str): Image format ('png', 'svg', ...) to render to. If given, the chart is returned as bytes
+                      instead of being shown.
+        save_path (str): File to write the rendered image to. The format is taken from the extension
+                         unless output is given.
+        max_columns (int): If set, only the max_columns most strongly correlated columns are shown.
+        annot_limit (int): Annotations are dropped automatically when more columns than this are shown.
+
+    Returns:
+        bytes or None: Rendered image when output, save_path or headless mode is used, otherwise None.
     """
     try:
-        plt.figure(figsize=size)
-        sns.heatmap(df.corr(), annot=annot, cmap=cmap, fmt='.2f')
-        plt.title(custom_title if custom_title else 'Heatmap of Correlation Matrix', fontsize=title_fontsize, fontweight='bold')
-        plt.show()
-        logging.info("Heatmap plotted successfully.")
+        columns = list(df.select_dtypes(include=['number']).columns)
+        corr = _correlation(df, columns)
+        columns = _top_correlated(corr, max_columns)
+        corr = corr.loc[columns, columns]
+        annot = annot and len(columns) <= annot_limit
+
+        fig, ax = _new_figure(size, output, save_path)
+        sns.heatmap(corr, annot=annot, cmap=cmap, fmt='.2f', ax=ax)
+        ax.set_title(custom_title if custom_title else 'Heatmap of Correlation Matrix', fontsize=title_fontsize, fontweight='bold')
+        image = _finish(fig, output, save_path)
+        logging.info(f"Heatmap plotted successfully for {len(columns)} columns (annot={annot}).")
+        return image
     except Exception as e:
         logging.error(f"Heatmap Error: {str(e)}")
         raise DataVisualizationError(f"Heatmap Error: {str(e)}")
 
+# Row and numeric column counts above which pairplot reduces its input, with a logged warning
+PAIRPLOT_MAX_ROWS = 100_000
+PAIRPLOT_MAX_COLUMNS = 12
+
 # Pair Plot
-def pairplot(df, hue=None, size=(10, 10), title_fontsize=16, custom_title=None):
+@_cached_render()
+def pairplot(df, hue=None, size=(10, 10), title_fontsize=16, custom_title=None, output=None, save_path=None,
+             max_rows=PAIRPLOT_MAX_ROWS, max_columns=PAIRPLOT_MAX_COLUMNS, random_state=0):
     """
     Plot a pairplot for all numeric columns in the DataFrame with advanced customization.
 
+    Frames above max_rows rows or max_columns numeric columns are reduced before plotting, and a
+    warning is logged: rows are subsampled per hue category and only the most strongly
+    correlated numeric columns are kept.
+
     Parameters:
         df (pd.DataFrame): Input DataFrame.
         hue (str): Column for color encoding.
         size (tuple): Figure size for each subplot.
         title_fontsize (int): Font size for the title.
         custom_title (str): Custom title for the chart. If None, a default title is used.
+        output (str): Image format ('png', 'svg', ...) to render to. If given, the chart is returned as bytes
+                      instead of being shown.
+        save_path (str): File to write the rendered image to. The format is taken from the extension
+                         unless output is given.
+        max_rows (int): Row count above which rows are sampled, stratified by hue, down to max_rows.
+                        None plots every row.
+        max_columns (int): Numeric column count above which only the max_columns columns with the strongest
+                           absolute correlation are plotted. None plots every numeric column.
+        random_state (int): Seed for the row subsample.
+
+    Returns:
+        bytes or None: Rendered image when output, save_path or headless mode is used, otherwise None.
     """
     try:
-        sns.pairplot(df, hue=hue, palette='coolwarm', height=size[0]/10)
-        plt.suptitle(custom_title if custom_title else 'Pair Plot', fontsize=title_fontsize, fontweight='bold', y=1.02)
-        plt.show()
-        logging.info("Pairplot plotted successfully.")
+        columns = [col for col in df.select_dtypes(include=['number']).columns if col != hue]
+        if max_columns is not None and len(columns) > max_columns:
+            logging.warning(f"Pairplot: plotting the {max_columns} most correlated of {len(columns)} numeric columns. "
+                            "Pass max_columns=None to plot them all.")
+            columns = _top_correlated(_correlation(df, columns), max_columns)
+        sample = _stratified_sample(df, hue, max_rows, random_state)
+        if len(sample) < len(df):
+            logging.warning(f"Pairplot: plotting a sample of {len(sample)} of {len(df)} rows. "
+                            "Pass max_rows=None to plot every row.")
+
+        # PairGrid builds its own pyplot figure; _finish closes it again in headless use
+        grid = sns.pairplot(sample, vars=columns, hue=hue, palette='coolwarm', height=size[0]/10)
+        fig = grid.figure
+        fig.suptitle(custom_title if custom_title else 'Pair Plot', fontsize=title_fontsize, fontweight='bold', y=1.02)
+        image = _finish(fig, output, save_path)
+        logging.info(f"Pairplot plotted successfully for {len(columns)} columns and {len(sample)} rows.")
+        return image
     except Exception as e:
         logging.error(f"Pairplot Error: {str(e)}")
         raise DataVisualizationError(f"Pairplot Error: {str(e)}")
 
 # Box Plot
-def boxplot(df, x_col, y_col, size=(10, 6), title_fontsize=16, axis_fontsize=14, custom_title=None):
+@_cached_render(['x_col', 'y_col'])
+def boxplot(df, x_col, y_col, size=(10, 6), title_fontsize=16, axis_fontsize=14, custom_title=None, stats=None, output=None, save_path=None):
     """
     Plot a box plot for specified columns with advanced customization.
 
     Parameters:
-        df (pd.DataFrame): Input DataFrame.
+        df (pd.DataFrame): Input DataFrame. May be None when stats is given.
         x_col (str): Column for x-axis.
         y_col (str): Column for y-axis.
         size (tuple): Figure size in the format (width, height).
         title_fontsize (int): Font size for the title.
         axis_fontsize (int): Font size for axis labels.
         custom_title (str): Custom title for the chart. If None, a default title is used.
+        stats (dict): Pre-aggregated statistics from distribution_stats(chunks, y_col, by=x_col).
+                      If given, quartiles and whiskers are drawn from the statistics.
+        output (str): Image format ('png', 'svg', ...) to render to. If given, the chart is returned as bytes
+                      instead of being shown.
+        save_path (str): File to write the rendered image to. The format is taken from the extension
+                         unless output is given.
+
+    Returns:
+        bytes or None: Rendered image when output, save_path or headless mode is used, otherwise None.
     """
     try:
-        plt.figure(figsize=size)
-        sns.boxplot(x=x_col, y=y_col, data=df, palette='Set2')
-        plt.title(custom_title if custom_title else f'Box Plot: {x_col} vs {y_col}', fontsize=title_fontsize, fontweight='bold')
-        plt.xlabel(x_col, fontsize=axis_fontsize)
-        plt.ylabel(y_col, fontsize=axis_fontsize)
-        plt.grid(True, linestyle='--', alpha=0.5)
-        plt.show()
+        fig, ax = _new_figure(size, output, save_path)
+        if stats is not None:
+            groups = _group_stats(stats, y_col)
+            artists = ax.bxp([group['box'] for group in groups], patch_artist=True, showfliers=False)
+            for patch, color in zip(artists['boxes'], sns.color_palette('Set2', len(groups))):
+                patch.set_facecolor(color)
+        else:
+            sns.boxplot(x=x_col, y=y_col, data=df, palette='Set2', ax=ax)
+        ax.set_title(custom_title if custom_title else f'Box Plot: {x_col} vs {y_col}', fontsize=title_fontsize, fontweight='bold')
+        ax.set_xlabel(x_col, fontsize=axis_fontsize)
+        ax.set_ylabel(y_col, fontsize=axis_fontsize)
+        ax.grid(True, linestyle='--', alpha=0.5)
+        image = _finish(fig, output, save_path)
         logging.info(f"Box Plot plotted for columns: {x_col} vs {y_col}")
+        return image
     except Exception as e:
         logging.error(f"Box Plot Error: {str(e)}")
         raise DataVisualizationError(f"Box Plot Error: {str(e)}")
 
 # Violin Plot
-def violinplot(df, x_col, y_col, size=(10, 6), title_fontsize=16, axis_fontsize=14, custom_title=None):
+@_cached_render(['x_col', 'y_col'])
+def violinplot(df, x_col, y_col, size=(10, 6), title_fontsize=16, axis_fontsize=14, custom_title=None, stats=None, output=None, save_path=None):
     """
     Plot a violin plot for specified columns with advanced customization.
 
     Parameters:
-        df (pd.DataFrame): Input DataFrame.
+        df (pd.DataFrame): Input DataFrame. May be None when stats is given.
         x_col (str): Column for x-axis.
         y_col (str): Column for y-axis.
         size (tuple): Figure size in the format (width, height).
         title_fontsize (int): Font size for the title.
         axis_fontsize (int): Font size for axis labels.
         custom_title (str): Custom title for the chart. If None, a default title is used.
+        stats (dict): Pre-aggregated statistics from distribution_stats(chunks, y_col, by=x_col).
+                      If given, the violins are drawn from the pre-computed KDE grids.
+        output (str): Image format ('png', 'svg', ...) to render to. If given, the chart is returned as bytes
+                      instead of being shown.
+        save_path (str): File to write the rendered image to. The format is taken from the extension
+                         unless output is given.
+
+    Returns:
+        bytes or None: Rendered image when output, save_path or headless mode is used, otherwise None.
     """
     try:
-        plt.figure(figsize=size)
-        sns.violinplot(x=x_col, y=y_col, data=df, palette='muted')
-        plt.title(custom_title if custom_title else f'Violin Plot: {x_col} vs {y_col}', fontsize=title_fontsize, fontweight='bold')
-        plt.xlabel(x_col, fontsize=axis_fontsize)
-        plt.ylabel(y_col, fontsize=axis_fontsize)
-        plt.grid(True, linestyle='--', alpha=0.5)
-        plt.show()
+        fig, ax = _new_figure(size, output, save_path)
+        if stats is not None:
+            groups = _group_stats(stats, y_col)
+            vpstats = [
+                {
+                    'coords': group['kde'][0],
+                    'vals': group['kde'][1],
+                    'mean': group['mean'],
+                    'median': group['box']['med'],
+                    'min': group['min'],
+                    'max': group['max']
+                }
+                for group in groups
+            ]
+            artists = ax.violin(vpstats, widths=0.8, showmedians=True)
+            for body, color in zip(artists['bodies'], sns.color_palette('muted', len(groups))):
+                body.set_facecolor(color)
+                body.set_alpha(0.8)
+            ax.set_xticks(range(1, len(groups) + 1))
+            ax.set_xticklabels([str(group['box']['label']) for group in groups])
+        else:
+            sns.violinplot(x=x_col, y=y_col, data=df, palette='muted', ax=ax)
+        ax.set_title(custom_title if custom_title else f'Violin Plot: {x_col} vs {y_col}', fontsize=title_fontsize, fontweight='bold')
+        ax.set_xlabel(x_col, fontsize=axis_fontsize)
+        ax.set_ylabel(y_col, fontsize=axis_fontsize)
+        ax.grid(True, linestyle='--', alpha=0.5)
+        image = _finish(fig, output, save_path)
         logging.info(f"Violin Plot plotted for columns: {x_col} vs {y_col}")
+        return image
     except Exception as e:
         logging.error(f"Violin Plot Error: {str(e)}")
         raise DataVisualizationError(f"Violin Plot Error: {str(e)}")
@@ -286,3 +753,71 @@ def interactive_plot(df):
     except Exception as e:
         logging.error(f"Interactive Visualization Error: {str(e)}")
         raise DataVisualizationError(f"Interactive Visualization Error: {str(e)}")
+
+# Plotting functions available to render_batch, keyed by chart spec 'kind'
+_PLOTS = {
+    'histogram': histogram,
+    'barchart': barchart,
+    'linechart': linechart,
+    'scatter': scatter,
+    'heatmap': heatmap,
+    'pairplot': pairplot,
+    'boxplot': boxplot,
+    'violinplot': violinplot
+}
+
+def _init_render_worker():
+    set_headless(True)
+
+def _render_spec(task):
+    """Render a single chart spec inside a worker; returns the saved path or the image bytes."""
+    index, spec, output, output_dir = task
+    spec = dict(spec)
+    kind = spec.pop('kind', None)
+    try:
+        if kind not in _PLOTS:
+            raise ValueError(f"Unknown chart kind '{kind}'. Choose from: {', '.join(_PLOTS)}.")
+        data = spec.pop('data', None)
+        if isinstance(data, str):
+            data = load.excel(data) if data.lower().endswith(('.xls', '.xlsx')) else load.csv(data)
+        filename = spec.pop('filename', None)
+        save_path = os.path.join(output_dir, filename or f"{index:04d}_{kind}.{output}") if output_dir else None
+        image = _PLOTS[kind](data, output=output, save_path=save_path, **spec)
+        return save_path if save_path else image
+    except Exception as e:
+        raise DataVisualizationError(f"Chart spec {index} ({kind}) failed: {str(e)}")
+
+def render_batch(specs, output='png', output_dir=None, workers=None):
+    """
+    Render many charts headlessly, spread across a process pool.
+
+    Each worker renders with the Agg backend on standalone figures and closes every figure
+    after saving it, so memory stays flat however many charts are produced.
+
+    Parameters:
+        specs (list of dict): Chart specs. Each spec has a 'kind' (name of a plotting function such as
+                              'histogram'), 'data' (a DataFrame or a path to a CSV/Excel file), an optional
+                              'filename', and any keyword arguments of that plotting function.
+        output (str): Image format for every chart ('png', 'svg', ...).
+        output_dir (str): Directory to write the images to. If None, image bytes are returned instead.
+        workers (int): Number of worker processes. None uses one per CPU; 1 renders in the current process.
+
+    Returns:
+        list: Image bytes, or file paths when output_dir is given, in the same order as specs.
+    """
+    try:
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        tasks = [(index, spec, output, output_dir) for index, spec in enumerate(specs)]
+
+        if workers == 1 or len(tasks) <= 1:
+            results = [_render_spec(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker) as executor:
+                results = list(executor.map(_render_spec, tasks))
+
+        logging.info(f"Batch rendering completed: {len(results)} charts as {output}.")
+        return results
+    except Exception as e:
+        logging.error(f"Batch Rendering Error: {str(e)}")
+        raise DataVisualizationError(f"Batch Rendering Error: {str(e)}")